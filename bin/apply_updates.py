@@ -8,9 +8,16 @@ import json
 import sys
 import urllib.request
 import urllib.error
+import yaml
 from pathlib import Path
 from typing import Dict, List
 
+# Use the libyaml based loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     import os
@@ -221,10 +228,8 @@ class UpdateApplier:
             return True
 
         try:
-            import yaml
-
             with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
 
             # Update versions in config
             for component, version in updates.items():
@@ -235,7 +240,7 @@ class UpdateApplier:
 
             # Save updated config
             with open(self.config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
             print(f"\n  ✓ Updated {self.config_file}")
             return True
@@ -4,37 +4,178 @@ Update checker for Minecraft server, Fabric loader, and mods.
 Checks for available updates based on configured versions and constraints.
 """
 import argparse
+import datetime
+import hashlib
 import json
+import os
+import re
 import sys
-import urllib.request
-import urllib.error
-from pathlib import Path
+import tempfile
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import yaml
 
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson decodes API responses and writes reports considerably faster when it is installed
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
+except ImportError:
+    from json import loads as json_loads
+    orjson_dumps = None
+
+# Add bin directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from http_pool import HttpPool
+from user_cache import private_cache_dir
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
-    import os
     os.system('chcp 65001 > nul 2>&1')
     if sys.stdout.encoding != 'utf-8':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Concurrent Modrinth lookups (kept low to stay within Modrinth's rate limits)
+MAX_WORKERS = 8
+
+# On-disk API response cache (a private per-user directory, see user_cache), TTLs in seconds
+CACHE_NAME = 'check_updates'
+MODRINTH_CACHE_TTL = 300
+MANIFEST_CACHE_TTL = 3600
+
+# Slugs resolved per /v2/projects request
+PROJECTS_BATCH_SIZE = 100
+
+MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+FABRIC_LOADER_URL = "https://meta.fabricmc.net/v2/versions/loader/{mc_version}"
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Report decorations
+_EQ70 = "=" * 70
+_DASH70 = "─" * 70
+_DASH66 = "─" * 66
+
+
+def _decode_first_item(data: bytes) -> object:
+    """
+    Decode only the first element of a JSON array, the rest is never parsed
+    Non-array documents are decoded as a whole
+    """
+    text = data.decode('utf-8')
+    index = 0
+    while index < len(text) and text[index] in ' \t\r\n':
+        index += 1
+    if not text.startswith('[', index):
+        return json.loads(text)
+
+    index += 1
+    while index < len(text) and text[index] in ' \t\r\n':
+        index += 1
+    if text.startswith(']', index):
+        return []
+
+    item, _ = _JSON_DECODER.raw_decode(text, index)
+    return [item]
+
+
+def _write_lines(lines: List[str], flush: bool = False):
+    """Write a block of report lines with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    if flush:
+        sys.stdout.flush()
+
+
+def _write_json(data: dict, output_file: str):
+    """Write data as indented UTF-8 JSON, using orjson when available"""
+    if orjson_dumps is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson_dumps(data, option=OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Release and pre-release part of a version, build metadata (+...) is dropped
+_VERSION_RE = re.compile(r'([^+-]*)(?:-([^+]*))?')
+# Dotted version parts as (digits, suffix), e.g. '2rc1' -> ('2', 'rc1')
+_VERSION_PART_RE = re.compile(r'(?:^|\.)(\d*)([^.]*)')
+
+
+def _split_version_parts(version: str) -> List[Tuple[int, str]]:
+    """Split a dotted version into (number, suffix) parts, e.g. '2rc1' -> (2, 'rc1')"""
+    return [(int(digits) if digits else -1, suffix)
+            for digits, suffix in _VERSION_PART_RE.findall(version)]
+
+
+@lru_cache(maxsize=None)
+def _version_key(version: str) -> tuple:
+    """
+    Build a sortable key for a version string
+    Build metadata (+...) is ignored and pre-releases sort before their
+    release, so 5.0.0-beta.2 < 5.0.0 == 5.0.0+1.21 < 5.0.1
+    """
+    release, pre_release = _VERSION_RE.match(version.replace('v', '')).groups()
+
+    release_parts = _split_version_parts(release)
+    # Trailing zeros don't change the version (1.0 == 1.0.0)
+    while release_parts and release_parts[-1] == (0, ''):
+        release_parts.pop()
+
+    pre_release_parts = _split_version_parts(pre_release) if pre_release else []
+    return tuple(release_parts), 0 if pre_release else 1, tuple(pre_release_parts)
+
 
 class UpdateChecker:
     """Main update checker class"""
 
-    def __init__(self, config_path: str = "config.yaml"):
+    # urllib.parse.quote('["fabric"]'), the loader used for almost every lookup
+    FABRIC_LOADERS_PARAM = '%5B%22fabric%22%5D'
+
+    def __init__(self, config_path: str = "config.yaml", use_cache: bool = True):
         self.config = self._load_config(config_path)
         self.mc_version = self.config.get('minecraft', {}).get('version')
         self.fabric_version = self.config.get('fabric', {}).get('version')
         self.mods = self.config.get('mods', [])
+        # Shared keep-alive connections for all API requests, rate limited
+        # (429) and temporarily failing requests are retried with backoff
+        self._http = HttpPool(timeout=10, retries=5)
+        self.use_cache = use_cache
+        # Responses already loaded during this run, keyed by cache key
+        self._json_cache: Dict[str, object] = {}
+        # Resolved Modrinth lookups, independent of the Fabric version being tested.
+        # Failed requests are not stored, so they are tried again when needed
+        self._search_cache: Dict[str, Optional[str]] = {}
+        self._versions_cache: Dict[Tuple[str, str, str, bool], List[dict]] = {}
+        # Encoded game_versions query parameters per MC version
+        self._mc_param_cache: Dict[str, str] = {}
+        # Parsed Mojang version manifest and Fabric loader versions per MC version
+        self._manifest_cache: Optional[dict] = None
+        self._fabric_loader_cache: Dict[str, List[str]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close pooled API connections"""
+        self._http.close()
 
     def _load_config(self, config_path: str) -> dict:
         """Load YAML configuration file"""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            with open(config_path, 'rb') as f:
+                config = yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
             print(f"Error: Configuration file '{config_path}' not found")
             sys.exit(1)
@@ -42,37 +183,140 @@ class UpdateChecker:
             print(f"Error parsing YAML: {e}")
             sys.exit(1)
 
-    def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[dict]:
-        """Fetch JSON data from URL"""
+        # Mod names and versions are used as keys over and over, intern them once
+        for mod in (config or {}).get('mods') or []:
+            for field in ('name', 'version'):
+                if isinstance(mod.get(field), str):
+                    mod[field] = sys.intern(mod[field])
+        return config
+
+    def _read_cache(self, key: str, ttl: int) -> Optional[object]:
+        """Return a cached response if it is younger than ttl seconds"""
+        if key in self._json_cache:
+            return self._json_cache[key]
+
+        cache_dir = private_cache_dir(CACHE_NAME)
+        if cache_dir is None:
+            return None
+
+        cache_path = cache_dir / (hashlib.sha1(key.encode()).hexdigest() + '.json')
         try:
-            req = urllib.request.Request(url)
-            if headers:
-                for key, value in headers.items():
-                    req.add_header(key, value)
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read())
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
+            if time.time() - cache_path.stat().st_mtime > ttl:
                 return None
-            print(f"  Error: HTTP {e.code} when fetching {url}")
+            with open(cache_path, 'rb') as f:
+                data = json_loads(f.read())
+        except (OSError, ValueError):
             return None
+
+        self._json_cache[key] = data
+        return data
+
+    def _write_cache(self, key: str, data: object):
+        """Store a response in the cache (best effort)"""
+        self._json_cache[key] = data
+
+        cache_dir = private_cache_dir(CACHE_NAME)
+        if cache_dir is None:
+            return
+
+        cache_path = cache_dir / (hashlib.sha1(key.encode()).hexdigest() + '.json')
+        try:
+            # Write to a temporary file first so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                    ttl: int = 0, first_item: bool = False) -> Optional[dict]:
+        """
+        Fetch JSON data from URL
+        Args:
+            ttl: Seconds a cached response stays valid (0 disables caching)
+            first_item: Only decode the first element of a JSON array response
+        """
+        cache_key = url + '#first' if first_item else url
+        use_cache = self.use_cache and ttl > 0
+        if use_cache:
+            cached = self._read_cache(cache_key, ttl)
+            if cached is not None:
+                return cached
+
+        try:
+            response = self._http.request('GET', url, headers)
+            if response.status == 404:
+                return None
+            if not 200 <= response.status < 300:
+                print(f"  Error: HTTP {response.status} when fetching {url}")
+                return None
+            data = _decode_first_item(response.data) if first_item else json_loads(response.data)
         except Exception as e:
             print(f"  Error fetching {url}: {e}")
             return None
 
+        if use_cache:
+            self._write_cache(cache_key, data)
+        return data
+
+    def _get_manifest(self) -> Optional[dict]:
+        """Fetch the Mojang version manifest, shared by all checks of this run"""
+        if self._manifest_cache is None:
+            self._manifest_cache = self._fetch_json(MANIFEST_URL, ttl=MANIFEST_CACHE_TTL)
+        return self._manifest_cache
+
+    def _get_fabric_versions(self, mc_version: str) -> Optional[List[str]]:
+        """
+        Get the Fabric loader versions available for a MC version (newest first)
+        Returns None if the loader list could not be fetched
+        """
+        if mc_version not in self._fabric_loader_cache:
+            loader_data = self._fetch_json(FABRIC_LOADER_URL.format(mc_version=mc_version),
+                                           ttl=MANIFEST_CACHE_TTL)
+            if not loader_data:
+                # Failures are not cached so a later call can try again
+                return None
+
+            # Extract loader versions
+            available_versions = []
+            for item in loader_data:
+                loader_info = item.get('loader', {})
+                version = loader_info.get('version')
+                if version:
+                    available_versions.append(sys.intern(version))
+            self._fabric_loader_cache[mc_version] = available_versions
+
+        return self._fabric_loader_cache[mc_version]
+
+    def _find_newer_releases(self, manifest: dict) -> Tuple[bool, List[str]]:
+        """
+        Find release versions newer than the current one (manifest lists newest first)
+        Returns: (current_found, newer_releases)
+        """
+        versions = manifest.get('versions', [])
+        ids = [v['id'] for v in versions]
+        try:
+            index = ids.index(self.mc_version)
+            current_found = True
+        except ValueError:
+            index = len(versions)
+            current_found = False
+
+        newer_releases = [sys.intern(v['id']) for v in versions[:index] if v['type'] == 'release']
+        return current_found, newer_releases
+
     def check_minecraft_updates(self) -> Tuple[str, Optional[str], List[str]]:
         """
         Check for Minecraft server updates
         Returns: (current_version, latest_version, newer_versions)
         """
-        print("\n" + "="*70)
+        print("\n" + _EQ70)
         print("MINECRAFT SERVER UPDATE CHECK")
-        print("="*70)
+        print(_EQ70)
         print(f"Current version: {self.mc_version}")
 
-        manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
-        manifest = self._fetch_json(manifest_url)
+        manifest = self._get_manifest()
 
         if not manifest:
             print("  ✗ Failed to fetch Minecraft version manifest")
@@ -85,16 +329,7 @@ class UpdateChecker:
         print(f"Latest snapshot: {latest_snapshot}")
 
         # Find newer versions
-        versions = manifest.get('versions', [])
-        current_found = False
-        newer_releases = []
-
-        for v in versions:
-            if v['id'] == self.mc_version:
-                current_found = True
-                break
-            if v['type'] == 'release':
-                newer_releases.append(v['id'])
+        current_found, newer_releases = self._find_newer_releases(manifest)
 
         if not current_found:
             print(f"  ⚠ Warning: Current version {self.mc_version} not found in manifest")
@@ -119,32 +354,19 @@ class UpdateChecker:
         """
         mc_ver = target_mc_version or self.mc_version
 
-        print("\n" + "="*70)
+        print("\n" + _EQ70)
         print("FABRIC LOADER UPDATE CHECK")
-        print("="*70)
+        print(_EQ70)
         print(f"Current Fabric version: {self.fabric_version}")
         print(f"Target MC version:      {mc_ver}")
 
         # Get all Fabric loader versions for this MC version
-        loader_url = f"https://meta.fabricmc.net/v2/versions/loader/{mc_ver}"
-        loader_data = self._fetch_json(loader_url)
+        available_versions = self._get_fabric_versions(mc_ver)
 
-        if not loader_data:
+        if available_versions is None:
             print(f"  ✗ Failed to fetch Fabric versions for Minecraft {mc_ver}")
             return self.fabric_version, None, []
 
-        if not loader_data:
-            print(f"  ✗ No Fabric versions available for Minecraft {mc_ver}")
-            return self.fabric_version, None, []
-
-        # Extract loader versions
-        available_versions = []
-        for item in loader_data:
-            loader_info = item.get('loader', {})
-            version = loader_info.get('version')
-            if version:
-                available_versions.append(version)
-
         if not available_versions:
             print("  ✗ No Fabric loader versions found")
             return self.fabric_version, None, []
@@ -152,15 +374,13 @@ class UpdateChecker:
         latest_version = available_versions[0]  # First is latest
         print(f"Latest Fabric version:  {latest_version}")
 
-        # Find newer versions
-        newer_versions = []
-        current_found = False
-
-        for ver in available_versions:
-            if ver == self.fabric_version:
-                current_found = True
-                break
-            newer_versions.append(ver)
+        # Find newer versions (listed before the current one)
+        try:
+            newer_versions = available_versions[:available_versions.index(self.fabric_version)]
+            current_found = True
+        except ValueError:
+            newer_versions = available_versions[:]
+            current_found = False
 
         if not current_found:
             print(f"  ⚠ Warning: Current version {self.fabric_version} not found for MC {mc_ver}")
@@ -178,11 +398,24 @@ class UpdateChecker:
 
     def _search_modrinth_project(self, mod_name: str) -> Optional[str]:
         """Search for a mod on Modrinth and return project ID"""
+        if mod_name in self._search_cache:
+            return self._search_cache[mod_name]
+
         search_url = f"https://api.modrinth.com/v2/search?query={mod_name}&limit=5"
         headers = {"User-Agent": "minecraft-server-update-checker/1.0"}
 
-        results = self._fetch_json(search_url, headers)
-        if not results or 'hits' not in results:
+        results = self._fetch_json(search_url, headers, ttl=MODRINTH_CACHE_TTL)
+        if results is None:
+            return None
+
+        project_id = self._match_search_hits(mod_name, results)
+        self._search_cache[mod_name] = project_id
+        return project_id
+
+    @staticmethod
+    def _match_search_hits(mod_name: str, results: dict) -> Optional[str]:
+        """Pick a mod's project ID from Modrinth search results"""
+        if 'hits' not in results:
             return None
 
         hits = results['hits']
@@ -199,99 +432,146 @@ class UpdateChecker:
         # Return first result as fallback
         return hits[0].get('project_id')
 
-    def _get_mod_versions(self, project_id: str, mc_version: str, loader: str = "fabric") -> List[dict]:
-        """Get available versions for a mod from Modrinth"""
-        import urllib.parse
+    def _resolve_projects_batch(self, slugs: List[str]) -> Dict[str, str]:
+        """
+        Resolve Modrinth slugs (or project IDs) to project IDs with the bulk projects endpoint
+        Returns: {slug: project_id} for every slug Modrinth knows
+        """
+        headers = {"User-Agent": "minecraft-server-update-checker/1.0"}
+        resolved = {}
+
+        for i in range(0, len(slugs), PROJECTS_BATCH_SIZE):
+            batch = slugs[i:i + PROJECTS_BATCH_SIZE]
+            ids_param = urllib.parse.quote(json.dumps(batch, separators=(',', ':')))
+            projects = self._fetch_json(f"https://api.modrinth.com/v2/projects?ids={ids_param}",
+                                        headers, ttl=MODRINTH_CACHE_TTL)
+            if not projects:
+                continue
+
+            by_key = {}
+            for project in projects:
+                by_key[project.get('slug', '').lower()] = project.get('id')
+                by_key[project.get('id')] = project.get('id')
 
-        versions_url = f"https://api.modrinth.com/v2/project/{project_id}/version"
-        # Modrinth expects JSON arrays - need to use quote_via for proper encoding
-        game_versions_param = urllib.parse.quote(f'["{mc_version}"]')
-        loaders_param = urllib.parse.quote(f'["{loader}"]')
-        url_with_params = f"{versions_url}?game_versions={game_versions_param}&loaders={loaders_param}"
+            for slug in batch:
+                project_id = by_key.get(slug.lower()) or by_key.get(slug)
+                if project_id:
+                    resolved[slug] = project_id
+
+        return resolved
+
+    def _get_mod_versions(self, project_id: str, mc_version: str, loader: str = "fabric",
+                          latest_only: bool = True) -> List[dict]:
+        """
+        Get available versions for a mod from Modrinth
+        Args:
+            latest_only: Only return the newest version (Modrinth sorts newest first)
+        """
+        cache_key = (project_id, mc_version, loader, latest_only)
+        if cache_key in self._versions_cache:
+            return self._versions_cache[cache_key]
+
+        # Modrinth expects URL-encoded JSON arrays
+        game_versions_param = self._mc_param_cache.get(mc_version)
+        if game_versions_param is None:
+            game_versions_param = urllib.parse.quote(f'["{mc_version}"]')
+            self._mc_param_cache[mc_version] = game_versions_param
+        if loader == "fabric":
+            loaders_param = self.FABRIC_LOADERS_PARAM
+        else:
+            loaders_param = urllib.parse.quote(f'["{loader}"]')
+
+        url_with_params = (f"https://api.modrinth.com/v2/project/{project_id}/version"
+                           f"?game_versions={game_versions_param}&loaders={loaders_param}")
 
         headers = {"User-Agent": "minecraft-server-update-checker/1.0"}
 
-        versions = self._fetch_json(url_with_params, headers)
-        return versions if versions else []
+        versions = self._fetch_json(url_with_params, headers, ttl=MODRINTH_CACHE_TTL, first_item=latest_only)
+        if versions is None:
+            return []
+
+        self._versions_cache[cache_key] = versions
+        return versions
 
     def _compare_versions(self, v1: str, v2: str) -> int:
         """
         Compare two version strings
         Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal
         """
-        try:
-            # Clean version strings
-            v1_clean = v1.split('+')[0].split('-')[0]
-            v2_clean = v2.split('+')[0].split('-')[0]
-
-            parts1 = [int(x) if x.isdigit() else x for x in v1_clean.replace('v', '').split('.')]
-            parts2 = [int(x) if x.isdigit() else x for x in v2_clean.replace('v', '').split('.')]
-
-            for i in range(max(len(parts1), len(parts2))):
-                p1 = parts1[i] if i < len(parts1) else 0
-                p2 = parts2[i] if i < len(parts2) else 0
-
-                if isinstance(p1, int) and isinstance(p2, int):
-                    if p1 > p2:
-                        return 1
-                    elif p1 < p2:
-                        return -1
-                else:
-                    if str(p1) > str(p2):
-                        return 1
-                    elif str(p1) < str(p2):
-                        return -1
-
-            return 0
-        except:
-            # Fallback to string comparison
-            if v1 > v2:
-                return 1
-            elif v1 < v2:
-                return -1
+        if v1 == v2:
             return 0
 
-    def check_full_compatibility(self, mc_version: str, fabric_version: str) -> Tuple[bool, Dict[str, dict], List[str]]:
+        key1 = _version_key(v1)
+        key2 = _version_key(v2)
+        return (key1 > key2) - (key1 < key2)
+
+    def _lookup_mods(self, mods: List[dict], mc_version: str) -> List[Tuple[Optional[str], List[dict]]]:
+        """
+        Resolve project IDs and versions of mods concurrently
+        Project IDs are resolved by slug in bulk, falling back to a search per mod.
+        Mods referring to the same Modrinth project are only queried once
+        Returns: (project_id, versions) for each mod, in the order of mods
+        """
+        # Resolve slugs in bulk first, only the rest goes through the search API
+        unresolved = {mod['name']: mod.get('slug') or mod['name']
+                      for mod in mods if mod['name'] not in self._search_cache}
+        if unresolved:
+            resolved = self._resolve_projects_batch(list(dict.fromkeys(unresolved.values())))
+            for mod_name, slug in unresolved.items():
+                if slug in resolved:
+                    self._search_cache[mod_name] = resolved[slug]
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            project_ids = list(executor.map(lambda m: self._search_modrinth_project(m['name']), mods))
+
+            unique_ids = list(dict.fromkeys(pid for pid in project_ids if pid))
+            versions = dict(zip(unique_ids, executor.map(
+                lambda pid: self._get_mod_versions(pid, mc_version), unique_ids)))
+
+        return [(pid, versions[pid] if pid else []) for pid in project_ids]
+
+    def _resolve_mod(self, project_id: Optional[str], versions: List[dict]) -> Optional[dict]:
+        """
+        Pick the latest version of a single mod
+        Returns: mod details or None if no compatible version exists
+        """
+        if not project_id or not versions:
+            return None
+
+        # Take the first (latest) version
+        latest = versions[0]
+        latest_version = latest.get('version_number')
+
+        if not latest_version:
+            return None
+
+        return {
+            'version': latest_version,
+            'url': latest.get('files', [{}])[0].get('url', 'N/A'),
+            'project_id': project_id
+        }
+
+    def check_full_compatibility(self, mc_version: str,
+                                 fabric_version: Optional[str] = None) -> Tuple[bool, Dict[str, dict], List[str]]:
         """
         Check if all mods are compatible with a specific MC and Fabric version
         Args:
             mc_version: Minecraft version to check
-            fabric_version: Fabric version to check
+            fabric_version: Fabric version to check (informational only - Modrinth
+                            mod versions depend on the loader, not the loader version)
         Returns: (all_compatible, mod_details, missing_mods)
         """
         mod_details = {}
         missing_mods = []
 
-        for mod in self.mods:
-            mod_name = mod.get('name')
-            if not mod_name:
-                continue
-
-            # Search for mod on Modrinth
-            project_id = self._search_modrinth_project(mod_name)
-            if not project_id:
-                missing_mods.append(mod_name)
-                continue
-
-            # Get available versions for this MC version
-            versions = self._get_mod_versions(project_id, mc_version)
-            if not versions:
-                missing_mods.append(mod_name)
-                continue
-
-            # Take the first (latest) version
-            latest = versions[0]
-            latest_version = latest.get('version_number')
-
-            if not latest_version:
+        mods = [mod for mod in self.mods if mod.get('name')]
+        for mod, (project_id, versions) in zip(mods, self._lookup_mods(mods, mc_version)):
+            mod_name = mod['name']
+            details = self._resolve_mod(project_id, versions)
+            if details is None:
                 missing_mods.append(mod_name)
-                continue
-
-            mod_details[mod_name] = {
-                'version': latest_version,
-                'url': latest.get('files', [{}])[0].get('url', 'N/A'),
-                'project_id': project_id
-            }
+            else:
+                mod_details[mod_name] = details
 
         all_compatible = len(missing_mods) == 0
         return all_compatible, mod_details, missing_mods
@@ -299,36 +579,26 @@ class UpdateChecker:
     def find_compatible_updates(self) -> Optional[Dict]:
         """
         Find the newest compatible MC/Fabric/Mods combination
-        Tests each newer MC version with available Fabric versions
+        Tests each newer MC version with its latest Fabric version
         Returns: Dict with compatible update info or None if no compatible update found
         """
-        print("\n" + "="*70)
+        print("\n" + _EQ70)
         print("COMPREHENSIVE UPDATE COMPATIBILITY CHECK")
-        print("="*70)
+        print(_EQ70)
         print(f"Current configuration:")
         print(f"  Minecraft: {self.mc_version}")
         print(f"  Fabric:    {self.fabric_version}")
         print(f"  Mods:      {len(self.mods)}")
 
         # Get newer Minecraft versions
-        manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
-        manifest = self._fetch_json(manifest_url)
+        manifest = self._get_manifest()
 
         if not manifest:
             print("\n  ✗ Failed to fetch Minecraft version manifest")
             return None
 
-        versions = manifest.get('versions', [])
-        current_found = False
-        newer_mc_versions = []
-
         # Find all newer release versions
-        for v in versions:
-            if v['id'] == self.mc_version:
-                current_found = True
-                break
-            if v['type'] == 'release':
-                newer_mc_versions.append(v['id'])
+        current_found, newer_mc_versions = self._find_newer_releases(manifest)
 
         if not newer_mc_versions:
             print("\n  ✓ Already running the latest Minecraft version")
@@ -337,83 +607,137 @@ class UpdateChecker:
         print(f"\nFound {len(newer_mc_versions)} newer MC version(s) to test")
         print("Testing compatibility (MC version → Fabric version → Mods)...\n")
 
-        # Test each MC version
+        # Test each MC version, output is written in one go per step
         for mc_ver in newer_mc_versions:
-            print(f"{'─'*70}")
-            print(f"Testing Minecraft {mc_ver}...")
+            out = [_DASH70, f"Testing Minecraft {mc_ver}..."]
 
             # Get available Fabric versions for this MC version
-            loader_url = f"https://meta.fabricmc.net/v2/versions/loader/{mc_ver}"
-            loader_data = self._fetch_json(loader_url)
+            fabric_versions = self._get_fabric_versions(mc_ver)
 
-            if not loader_data:
-                print(f"  ✗ No Fabric support available for MC {mc_ver}")
-                print(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+            if fabric_versions is None:
+                out.append(f"  ✗ No Fabric support available for MC {mc_ver}")
+                out.append(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+                _write_lines(out)
                 break
 
-            # Extract Fabric versions
-            fabric_versions = []
-            for item in loader_data:
-                loader_info = item.get('loader', {})
-                version = loader_info.get('version')
-                if version:
-                    fabric_versions.append(version)
-
             if not fabric_versions:
-                print(f"  ✗ No Fabric loader versions found for MC {mc_ver}")
-                print(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+                out.append(f"  ✗ No Fabric loader versions found for MC {mc_ver}")
+                out.append(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+                _write_lines(out)
                 break
 
-            print(f"  Found {len(fabric_versions)} Fabric version(s)")
-
-            # Test each Fabric version for this MC version
-            for fabric_ver in fabric_versions:
-                print(f"    Testing Fabric {fabric_ver}...")
-
-                compatible, mod_details, missing_mods = self.check_full_compatibility(mc_ver, fabric_ver)
-
-                if compatible:
-                    print(f"      ✓ All {len(self.mods)} mod(s) compatible!")
-                    print(f"\n{'='*70}")
-                    print(f"✓ COMPATIBLE UPDATE FOUND!")
-                    print(f"{'='*70}")
-                    print(f"  Minecraft: {self.mc_version} → {mc_ver}")
-                    print(f"  Fabric:    {self.fabric_version} → {fabric_ver}")
-                    print(f"  Mods:      {len(mod_details)} updated")
-
-                    # Return the compatible configuration
-                    return {
-                        'minecraft': {
-                            'current_version': self.mc_version,
-                            'new_version': mc_ver
-                        },
-                        'fabric': {
-                            'current_version': self.fabric_version,
-                            'new_version': fabric_ver
-                        },
-                        'mods': mod_details,
-                        'tested_versions': {
-                            'mc_versions_tested': newer_mc_versions.index(mc_ver) + 1,
-                            'fabric_versions_tested': fabric_versions.index(fabric_ver) + 1
-                        }
+            out.append(f"  Found {len(fabric_versions)} Fabric version(s)")
+
+            # Mod versions only depend on the MC version and the loader, not on the
+            # Fabric loader version, so the mods are checked once with the latest Fabric
+            fabric_ver = fabric_versions[0]
+            out.append(f"    Testing mods with latest Fabric {fabric_ver}...")
+            # Show progress before the (slow) mod lookups
+            _write_lines(out, flush=True)
+
+            compatible, mod_details, missing_mods = self.check_full_compatibility(mc_ver, fabric_ver)
+
+            if compatible:
+                _write_lines([
+                    f"      ✓ All {len(self.mods)} mod(s) compatible!",
+                    "",
+                    _EQ70,
+                    "✓ COMPATIBLE UPDATE FOUND!",
+                    _EQ70,
+                    f"  Minecraft: {self.mc_version} → {mc_ver}",
+                    f"  Fabric:    {self.fabric_version} → {fabric_ver}",
+                    f"  Mods:      {len(mod_details)} updated",
+                ])
+
+                # Return the compatible configuration
+                return {
+                    'minecraft': {
+                        'current_version': self.mc_version,
+                        'new_version': mc_ver
+                    },
+                    'fabric': {
+                        'current_version': self.fabric_version,
+                        'new_version': fabric_ver
+                    },
+                    'mods': mod_details,
+                    'tested_versions': {
+                        'mc_versions_tested': newer_mc_versions.index(mc_ver) + 1,
+                        'fabric_versions_tested': 1
                     }
-                else:
-                    print(f"      ✗ {len(missing_mods)} mod(s) incompatible: {', '.join(missing_mods[:5])}")
-                    if len(missing_mods) > 5:
-                        print(f"        ... and {len(missing_mods) - 5} more")
-
-            # If we get here, no compatible Fabric version was found for this MC version
-            print(f"  ⚠ No compatible Fabric version found for MC {mc_ver}")
-            print(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+                }
+
+            out = [f"      ✗ {len(missing_mods)} mod(s) incompatible: {', '.join(missing_mods[:5])}"]
+            if len(missing_mods) > 5:
+                out.append(f"        ... and {len(missing_mods) - 5} more")
+
+            # Other Fabric versions would give the same result, so stop at this MC version
+            out.append(f"  ⚠ Cannot update to MC {mc_ver} - stopping here\n")
+            _write_lines(out)
             break
 
-        print(f"{'='*70}")
-        print("✗ NO COMPATIBLE UPDATE FOUND")
-        print(f"{'='*70}")
-        print("Unable to find a newer version where all components are compatible")
+        _write_lines([
+            _EQ70,
+            "✗ NO COMPATIBLE UPDATE FOUND",
+            _EQ70,
+            "Unable to find a newer version where all components are compatible",
+        ])
 
         return None
 
+    def _check_mod_update(self, mod: dict, mc_ver: str, project_id: Optional[str],
+                          versions: List[dict]) -> Tuple[str, List[str], Optional[dict]]:
+        """
+        Check a single mod for updates
+        Returns: (status, output_lines, update_info)
+        status is one of 'up_to_date', 'update' or 'error'
+        """
+        mod_name = mod['name']
+        current_version = mod['version']
+
+        lines = [f"\n  [{mod_name}]", f"    Current: {current_version}"]
+
+        if not project_id:
+            lines.append(f"    ⚠ Not found on Modrinth")
+            return 'error', lines, None
+
+        if not versions:
+            lines.append(f"    ⚠ No versions available for MC {mc_ver}")
+            return 'error', lines, None
+
+        # Find latest version
+        latest = versions[0]  # Modrinth returns sorted by newest
+        latest_version = latest.get('version_number')
+
+        if not latest_version:
+            lines.append(f"    ⚠ Could not determine latest version")
+            return 'error', lines, None
+
+        lines.append(f"    Latest:  {latest_version}")
+
+        # Compare versions
+        if latest_version == current_version:
+            lines.append(f"    ✓ Up to date")
+            return 'up_to_date', lines, None
+
+        # Versions differing only in build metadata (+...) are the same release
+        if latest_version.split('+', 1)[0] == current_version.split('+', 1)[0]:
+            lines.append(f"    ✓ Up to date (versions match)")
+            return 'up_to_date', lines, None
+
+        comparison = self._compare_versions(latest_version, current_version)
+        if comparison > 0:
+            lines.append(f"    📦 Update available!")
+            return 'update', lines, {
+                'current': current_version,
+                'latest': latest_version,
+                'url': latest.get('files', [{}])[0].get('url', 'N/A')
+            }
+        elif comparison < 0:
+            lines.append(f"    ⚠ Current version is newer than latest on Modrinth")
+        else:
+            lines.append(f"    ✓ Up to date (versions match)")
+        return 'up_to_date', lines, None
+
     def check_mod_updates(self, target_mc_version: Optional[str] = None) -> Dict[str, dict]:
         """
         Check for mod updates
@@ -423,9 +747,9 @@ class UpdateChecker:
         """
         mc_ver = target_mc_version or self.mc_version
 
-        print("\n" + "="*70)
+        print("\n" + _EQ70)
         print("MOD UPDATE CHECK")
-        print("="*70)
+        print(_EQ70)
         print(f"Target MC version: {mc_ver}")
         print(f"Checking {len(self.mods)} mods...")
 
@@ -434,63 +758,21 @@ class UpdateChecker:
         has_updates = 0
         errors = 0
 
-        for mod in self.mods:
-            mod_name = mod.get('name')
-            current_version = mod.get('version')
-
-            if not mod_name or not current_version:
-                continue
-
-            print(f"\n  [{mod_name}]")
-            print(f"    Current: {current_version}")
-
-            # Search for mod on Modrinth
-            project_id = self._search_modrinth_project(mod_name)
-            if not project_id:
-                print(f"    ⚠ Not found on Modrinth")
-                errors += 1
-                continue
-
-            # Get available versions
-            versions = self._get_mod_versions(project_id, mc_ver)
-            if not versions:
-                print(f"    ⚠ No versions available for MC {mc_ver}")
-                errors += 1
-                continue
-
-            # Find latest version
-            latest = versions[0]  # Modrinth returns sorted by newest
-            latest_version = latest.get('version_number')
-
-            if not latest_version:
-                print(f"    ⚠ Could not determine latest version")
-                errors += 1
-                continue
-
-            print(f"    Latest:  {latest_version}")
+        # Mods are looked up concurrently, output is printed in config order afterwards
+        mods = [mod for mod in self.mods if mod.get('name') and mod.get('version')]
+        for mod, (project_id, versions) in zip(mods, self._lookup_mods(mods, mc_ver)):
+            status, lines, update = self._check_mod_update(mod, mc_ver, project_id, versions)
+            _write_lines(lines)
 
-            # Compare versions
-            if latest_version == current_version:
-                print(f"    ✓ Up to date")
+            if status == 'update':
+                has_updates += 1
+                updates[mod['name']] = update
+            elif status == 'up_to_date':
                 up_to_date += 1
             else:
-                comparison = self._compare_versions(latest_version, current_version)
-                if comparison > 0:
-                    print(f"    📦 Update available!")
-                    has_updates += 1
-                    updates[mod_name] = {
-                        'current': current_version,
-                        'latest': latest_version,
-                        'url': latest.get('files', [{}])[0].get('url', 'N/A')
-                    }
-                elif comparison < 0:
-                    print(f"    ⚠ Current version is newer than latest on Modrinth")
-                    up_to_date += 1
-                else:
-                    print(f"    ✓ Up to date (versions match)")
-                    up_to_date += 1
-
-        print(f"\n  {'─'*66}")
+                errors += 1
+
+        print("\n  " + _DASH66)
         print(f"  Summary: {up_to_date} up-to-date | {has_updates} updates available | {errors} errors")
 
         return updates
@@ -498,9 +780,9 @@ class UpdateChecker:
 
 def print_summary(mc_result: Tuple, fabric_result: Tuple, mod_updates: Dict):
     """Print final summary of all updates"""
-    print("\n" + "="*70)
+    print("\n" + _EQ70)
     print("UPDATE SUMMARY")
-    print("="*70)
+    print(_EQ70)
 
     mc_current, mc_latest, mc_newer = mc_result
     fabric_current, fabric_latest, fabric_newer = fabric_result
@@ -527,7 +809,7 @@ def print_summary(mc_result: Tuple, fabric_result: Tuple, mod_updates: Dict):
     else:
         print(f"  ✓ All mods up to date")
 
-    print("\n" + "="*70)
+    print("\n" + _EQ70)
 
 
 def save_updates(mc_result: Tuple, fabric_result: Tuple, mod_updates: Dict, output_file: str):
@@ -543,7 +825,7 @@ def save_updates(mc_result: Tuple, fabric_result: Tuple, mod_updates: Dict, outp
     fabric_current, fabric_latest, fabric_newer = fabric_result
 
     update_data = {
-        "timestamp": json.dumps(None),  # Will be replaced with actual timestamp
+        "timestamp": datetime.datetime.now().isoformat(),
         "minecraft": {
             "current_version": mc_current,
             "latest_version": mc_latest,
@@ -567,14 +849,9 @@ def save_updates(mc_result: Tuple, fabric_result: Tuple, mod_updates: Dict, outp
             "download_url": info['url']
         }
 
-    # Add timestamp
-    import datetime
-    update_data["timestamp"] = datetime.datetime.now().isoformat()
-
     # Save to file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(update_data, f, indent=2, ensure_ascii=False)
+        _write_json(update_data, output_file)
         print(f"Update information saved to: {output_file}")
 
         # Print summary of what was saved
@@ -597,8 +874,6 @@ def save_compatibility_report(compat_data: Optional[Dict], output_file: str):
         compat_data: Dict with compatibility information or None if no compatible update
         output_file: Path to output JSON file
     """
-    import datetime
-
     if compat_data is None:
         report = {
             "timestamp": datetime.datetime.now().isoformat(),
@@ -632,17 +907,16 @@ def save_compatibility_report(compat_data: Optional[Dict], output_file: str):
 
     # Save to file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_json(report, output_file)
 
-        print(f"\n{'='*70}")
+        print("\n" + _EQ70)
         if compat_data:
             print(f"✓ Compatibility report saved to: {output_file}")
             print(f"  This file can be used with apply_updates.py to perform the update")
         else:
             print(f"✗ Report saved to: {output_file}")
             print(f"  No compatible update is available at this time")
-        print(f"{'='*70}")
+        print(_EQ70)
 
     except Exception as e:
         print(f"Error saving compatibility report: {e}")
@@ -695,51 +969,55 @@ def main():
         default='compatibility_report.json',
         help='Output file for compatibility report (default: compatibility_report.json)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached API responses and always query the APIs'
+    )
 
     args = parser.parse_args()
 
-    checker = UpdateChecker()
+    with UpdateChecker(use_cache=not args.no_cache) as checker:
+        # Handle full compatibility check
+        if args.full_check:
+            compat_data = checker.find_compatible_updates()
+            save_compatibility_report(compat_data, args.compat_output)
+            print()
+            return
 
-    # Handle full compatibility check
-    if args.full_check:
-        compat_data = checker.find_compatible_updates()
-        save_compatibility_report(compat_data, args.compat_output)
-        print()
-        return
+        # If no specific flag is set, check all
+        check_all = args.all or not (args.mc or args.fabric or args.mods)
 
-    # If no specific flag is set, check all
-    check_all = args.all or not (args.mc or args.fabric or args.mods)
+        mc_result = (checker.mc_version, None, [])
+        fabric_result = (checker.fabric_version, None, [])
+        mod_updates = {}
 
-    mc_result = (checker.mc_version, None, [])
-    fabric_result = (checker.fabric_version, None, [])
-    mod_updates = {}
+        target_mc_version = args.mc_version
 
-    target_mc_version = args.mc_version
+        # Check Minecraft updates
+        if check_all or args.mc:
+            mc_result = checker.check_minecraft_updates()
 
-    # Check Minecraft updates
-    if check_all or args.mc:
-        mc_result = checker.check_minecraft_updates()
+        # Check Fabric updates
+        if check_all or args.fabric:
+            fabric_result = checker.check_fabric_updates(target_mc_version)
 
-    # Check Fabric updates
-    if check_all or args.fabric:
-        fabric_result = checker.check_fabric_updates(target_mc_version)
+            # If checking for new MC version, also check mod compatibility
+            if target_mc_version and target_mc_version != checker.mc_version:
+                print(f"\n  ℹ Checking mod compatibility with MC {target_mc_version}...")
 
-        # If checking for new MC version, also check mod compatibility
-        if target_mc_version and target_mc_version != checker.mc_version:
-            print(f"\n  ℹ Checking mod compatibility with MC {target_mc_version}...")
+        # Check mod updates
+        if check_all or args.mods or (args.fabric and target_mc_version):
+            mod_updates = checker.check_mod_updates(target_mc_version)
 
-    # Check mod updates
-    if check_all or args.mods or (args.fabric and target_mc_version):
-        mod_updates = checker.check_mod_updates(target_mc_version)
+        # Print summary
+        if check_all:
+            print_summary(mc_result, fabric_result, mod_updates)
 
-    # Print summary
-    if check_all:
-        print_summary(mc_result, fabric_result, mod_updates)
+        # Save updates to file
+        save_updates(mc_result, fabric_result, mod_updates, args.output)
 
-    # Save updates to file
-    save_updates(mc_result, fabric_result, mod_updates, args.output)
-
-    print()
+        print()
 
 
 if __name__ == '__main__':
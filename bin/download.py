@@ -5,17 +5,36 @@ Downloads based on config.yaml and source_mappings.yaml
 """
 import os
 import sys
+import hashlib
 import json
+import logging
+import queue
+import time
 import yaml
 import urllib.request
-import urllib.error
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson reads and writes the download cache considerably faster when it is installed
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
+except ImportError:
+    from json import loads as json_loads
+    orjson_dumps = None
+
 # Add bin directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from env_loader import load_dotenv, get_env
+from http_pool import HttpPool
 
 # Load .env file if it exists
 load_dotenv()
@@ -27,118 +46,275 @@ if sys.platform == 'win32':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+logger = logging.getLogger(__name__)
+
+SEPARATOR = "=" * 70
+THIN_SEPARATOR = "─" * 70
+
+# Default number of concurrent resolutions / downloads
+MAX_WORKERS = 8
+
+# Buffer size for streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Read size when hashing downloaded files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Conditional request entries not used for this long (seconds) are dropped from the cache
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def _file_size(path: str) -> Optional[int]:
+    """Size of a file in bytes, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _file_sha1(path: str) -> Optional[str]:
+    """SHA-1 hex digest of a file, or None if it can't be read"""
+    sha1 = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                sha1.update(chunk)
+    except OSError:
+        return None
+    return sha1.hexdigest()
+
 
 class DownloadManager:
     """Manages downloads with caching support"""
 
     def __init__(self, config_file: str = "config.yaml",
                  mappings_file: str = "source_mappings.yaml",
-                 cache_file: str = ".download_cache.json"):
+                 cache_file: str = ".download_cache.json",
+                 max_workers: int = MAX_WORKERS):
         self.config = self._load_yaml(config_file)
         self.mappings = self._load_yaml(mappings_file)
+        # Identifies the config the cached download list was built from
+        self.config_hash = self._hash_files(config_file, mappings_file)
         self.cache_file = cache_file
+        self.max_workers = max(1, max_workers)
         self.cache = self._load_cache()
         self.minecraft_version = self.config.get('minecraft', {}).get('version')
         self.curseforge_api_key = os.environ.get('CURSEFORGE_API_KEY')
+        # Shared keep-alive connections for the Mojang, Modrinth and CurseForge APIs
+        self._http = HttpPool(timeout=30, retries=3)
+        # Responses already fetched during this run, keyed by URL
+        self._json_cache: Dict[str, object] = {}
+        # Directories already created for downloads
+        self._created_dirs = set()
+        # Minecraft server downloads ({'url', 'size', 'sha1'}) by version, these never change for a release
+        self.server_urls: Dict[str, dict] = self.cache.get('server_urls', {})
+        # Mojang version manifest entries by version id
+        self._mojang_versions: Optional[Dict[str, dict]] = None
+        # CurseForge files fetched in bulk, keyed by file ID
+        self._curseforge_files: Dict[str, dict] = {}
+        # Validators and bodies of earlier responses, revalidated with conditional requests
+        self.http_cache: Dict[str, dict] = self.cache.get('http_cache', {})
+        # Names of mods whose files were already checked against their SHA-1 during this run
+        self._verified_mods = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close pooled API connections"""
+        self._http.close()
 
     def _load_yaml(self, file_path: str) -> dict:
         """Load YAML configuration file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                return yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
-            print(f"Error: File '{file_path}' not found")
+            logger.error("Error: File '%s' not found", file_path)
             sys.exit(1)
         except yaml.YAMLError as e:
-            print(f"Error parsing YAML in {file_path}: {e}")
+            logger.error("Error parsing YAML in %s: %s", file_path, e)
             sys.exit(1)
 
+    @staticmethod
+    def _hash_files(*file_paths: str) -> str:
+        """Hash the contents of the given files"""
+        digest = hashlib.blake2b()
+        for file_path in file_paths:
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
     def _load_cache(self) -> dict:
         """Load download cache from JSON file"""
         if not os.path.exists(self.cache_file):
-            print(f"No cache file found at {self.cache_file}")
+            logger.info("No cache file found at %s", self.cache_file)
             return {}
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-                print(f"Loaded cache file: {self.cache_file}")
+            with open(self.cache_file, 'rb') as f:
+                cache = json_loads(f.read())
+                logger.info("Loaded cache file: %s", self.cache_file)
                 return cache
-        except json.JSONDecodeError as e:
-            print(f"Warning: Cache file is corrupted: {e}")
+        except ValueError as e:
+            logger.warning("Warning: Cache file is corrupted: %s", e)
             return {}
 
     def _save_cache(self):
         """Save download cache to JSON file"""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-            print(f"\n✓ Cache saved to: {self.cache_file}")
+            if orjson_dumps is not None:
+                with open(self.cache_file, 'wb') as f:
+                    f.write(orjson_dumps(self.cache, option=OPT_INDENT_2))
+            else:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.cache, f, indent=2, ensure_ascii=False)
+            logger.info("\n✓ Cache saved to: %s", self.cache_file)
         except Exception as e:
-            print(f"Warning: Failed to save cache: {e}")
+            logger.warning("Warning: Failed to save cache: %s", e)
 
     def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[dict]:
-        """Fetch JSON data from URL"""
+        """
+        Fetch JSON data from URL
+        Successful responses are kept in memory, so every URL is only fetched once per run
+        """
+        if url in self._json_cache:
+            return self._json_cache[url]
+
+        # Ask the server to only send the body if it changed since the last run
+        request_headers = dict(headers or {})
+        cached = self.http_cache.get(url)
+        if cached:
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                request_headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            req = urllib.request.Request(url)
-            if headers:
-                for key, value in headers.items():
-                    req.add_header(key, value)
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return json.loads(response.read())
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
+            response = self._http.request('GET', url, request_headers)
+            if response.status == 304 and cached:
+                cached['used'] = time.time()
+                self._json_cache[url] = cached['body']
+                return cached['body']
+            if response.status == 404:
                 return None
-            print(f"  Error: HTTP {e.code} when fetching {url}")
-            return None
+            if not 200 <= response.status < 300:
+                logger.error("  Error: HTTP %s when fetching %s", response.status, url)
+                return None
+            data = json_loads(response.data)
+            self._json_cache[url] = data
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.http_cache[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'used': time.time(),
+                    'body': data
+                }
+            return data
         except Exception as e:
-            print(f"  Error fetching {url}: {e}")
+            logger.error("  Error fetching %s: %s", url, e)
             return None
 
-    def _download_file(self, url: str, destination: str) -> bool:
-        """Download a file from URL to destination"""
+    def _ensure_dir(self, file_path: str):
+        """Create the directory of a file unless it was already created during this run"""
+        directory = os.path.dirname(file_path) or '.'
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _download_file(self, url: str, destination: str, log: List[str],
+                       sha1: Optional[str] = None) -> bool:
+        """
+        Download a file from URL to destination
+        The file is written to a .part file first and only moved into place once
+        it is complete (and matches sha1 if given), so an interrupted download
+        never leaves a truncated file behind.
+        Progress messages are appended to log instead of printed, so concurrent
+        downloads don't interleave their output
+        """
+        part_file = destination + '.part'
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(destination) if os.path.dirname(destination) else '.', exist_ok=True)
+            self._ensure_dir(destination)
 
-            print(f"  Downloading: {url}")
+            log.append(f"  Downloading: {url}")
             req = urllib.request.Request(url)
             req.add_header('User-Agent', 'minecraft-server-manager/1.0')
 
+            digest = hashlib.sha1()
             with urllib.request.urlopen(req, timeout=60) as response:
-                with open(destination, 'wb') as out_file:
-                    shutil.copyfileobj(response, out_file)
-
-            file_size = os.path.getsize(destination)
-            print(f"  ✓ Downloaded: {destination} ({file_size:,} bytes)")
+                with open(part_file, 'wb') as out_file:
+                    # Read into one reusable buffer instead of allocating a new chunk per read
+                    buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+                    file_size = 0
+                    while True:
+                        size = response.readinto(buffer)
+                        if not size:
+                            break
+                        chunk = buffer[:size]
+                        out_file.write(chunk)
+                        digest.update(chunk)
+                        file_size += size
+
+            if sha1 and digest.hexdigest() != sha1.lower():
+                log.append(f"  ✗ Error downloading: SHA-1 mismatch (expected {sha1}, got {digest.hexdigest()})")
+                return False
+
+            os.replace(part_file, destination)
+            log.append(f"  ✓ Downloaded: {destination} ({file_size:,} bytes)")
             return True
 
         except Exception as e:
-            print(f"  ✗ Error downloading: {e}")
-            if os.path.exists(destination):
-                os.remove(destination)
+            log.append(f"  ✗ Error downloading: {e}")
             return False
 
-    def _resolve_minecraft_url(self, version: str) -> Optional[Tuple[str, str]]:
-        """Resolve Minecraft server download URL"""
+        finally:
+            if os.path.exists(part_file):
+                os.remove(part_file)
+
+    def _get_mojang_versions(self) -> Optional[Dict[str, dict]]:
+        """Get the Mojang version manifest entries by version id, built on first use"""
+        if self._mojang_versions is None:
+            manifest = self._fetch_json(self.mappings['sources']['mojang']['manifest_url'])
+            if not manifest:
+                return None
+            self._mojang_versions = {v['id']: v for v in manifest.get('versions', [])}
+        return self._mojang_versions
+
+    def _resolve_minecraft_url(self, version: str) -> Optional[Tuple[str, str, Optional[int], Optional[str]]]:
+        """
+        Resolve Minecraft server download URL
+        Returns: (download_url, filename, size, sha1)
+        """
         source_config = self.mappings['sources']['mojang']
-        manifest_url = source_config['manifest_url']
+        filename = source_config['filename_pattern']
+
+        # Known from an earlier run, no manifest lookups needed (older caches only stored the URL)
+        server = self.server_urls.get(version)
+        if isinstance(server, dict):
+            return (server['url'], filename, server.get('size'), server.get('sha1'))
 
-        manifest = self._fetch_json(manifest_url)
-        if not manifest:
+        versions = self._get_mojang_versions()
+        if not versions:
             return None
 
         # Find the requested version
-        for v in manifest.get('versions', []):
-            if v['id'] == version:
-                # Get version-specific details
-                version_info = self._fetch_json(v['url'])
-                if version_info:
-                    server_url = version_info.get('downloads', {}).get('server', {}).get('url')
-                    if server_url:
-                        filename = source_config['filename_pattern']
-                        return (server_url, filename)
+        v = versions.get(version)
+        if not v:
+            return None
+
+        # Get version-specific details
+        version_info = self._fetch_json(v['url'])
+        if version_info:
+            server = version_info.get('downloads', {}).get('server', {})
+            if server.get('url'):
+                self.server_urls[version] = {'url': server['url'], 'size': server.get('size'), 'sha1': server.get('sha1')}
+                return (server['url'], filename, server.get('size'), server.get('sha1'))
 
         return None
 
@@ -152,10 +328,11 @@ class DownloadManager:
         filename = source_config['filename_pattern']
         return (url, filename)
 
-    def _resolve_modrinth_url(self, mod_name: str, version: str, slug: Optional[str] = None) -> Optional[Tuple[str, str, str]]:
+    def _resolve_modrinth_url(self, mod_name: str, version: str,
+                              slug: Optional[str] = None) -> Optional[Tuple[str, str, str, Optional[int], Optional[str]]]:
         """
         Resolve Modrinth mod download URL
-        Returns: (download_url, filename, resolved_slug)
+        Returns: (download_url, filename, resolved_slug, size, sha1)
         """
         source_config = self.mappings['sources']['modrinth']
 
@@ -189,7 +366,9 @@ class DownloadManager:
                         # Use slug-based filename for version management
                         filename = f"{project_id}.jar"
                         if download_url:
-                            return (download_url, filename, project_id)
+                            size = primary_file.get('size')
+                            sha1 = primary_file.get('hashes', {}).get('sha1')
+                            return (download_url, filename, project_id, size, sha1)
 
         return None
 
@@ -206,6 +385,34 @@ class DownloadManager:
 
         return (download_url, filename)
 
+    def _curseforge_headers(self) -> Dict[str, str]:
+        """Headers for CurseForge API requests"""
+        return {
+            'Accept': 'application/json',
+            'x-api-key': self.curseforge_api_key
+        }
+
+    def _prefetch_curseforge_files(self, mods_config: List[dict]):
+        """Fetch all CurseForge files pinned with a file_id in one bulk request"""
+        file_ids = [int(mod['file_id']) for mod in mods_config
+                    if mod.get('source') == 'curseforge' and mod.get('project_id') and
+                    str(mod.get('file_id', '')).isdigit()]
+        if not file_ids or not self.curseforge_api_key:
+            return
+
+        url = f"{self.mappings['sources']['curseforge']['api_base']}/mods/files"
+        headers = self._curseforge_headers()
+        headers['Content-Type'] = 'application/json'
+        try:
+            response = self._http.request('POST', url, headers, json.dumps({'fileIds': file_ids}).encode())
+            if not 200 <= response.status < 300:
+                logger.error("  Error: HTTP %s when fetching %s", response.status, url)
+                return
+            for file_data in json_loads(response.data).get('data', []):
+                self._curseforge_files[str(file_data.get('id'))] = file_data
+        except Exception as e:
+            logger.error("  Error fetching %s: %s", url, e)
+
     def _resolve_curseforge_url(self, mod_name: str, version: str, project_id: int,
                                 file_id: Optional[int] = None) -> Optional[Tuple[str, str]]:
         """
@@ -213,22 +420,22 @@ class DownloadManager:
         Returns: (download_url, filename)
         """
         if not self.curseforge_api_key:
-            print(f"  Error: CurseForge API key not set")
+            logger.error("  Error: CurseForge API key not set")
             return None
 
         source_config = self.mappings['sources']['curseforge']
-        headers = {
-            'Accept': 'application/json',
-            'x-api-key': self.curseforge_api_key
-        }
+        headers = self._curseforge_headers()
 
-        # If file_id is provided, fetch that specific file
+        # If file_id is provided, use that specific file (usually prefetched in bulk)
         if file_id:
-            file_url = f"{source_config['api_base']}/mods/{project_id}/files/{file_id}"
-            file_info = self._fetch_json(file_url, headers)
-
-            if file_info and 'data' in file_info:
-                file_data = file_info['data']
+            file_data = self._curseforge_files.get(str(file_id))
+            if file_data is None:
+                file_url = f"{source_config['api_base']}/mods/{project_id}/files/{file_id}"
+                file_info = self._fetch_json(file_url, headers)
+                if file_info and 'data' in file_info:
+                    file_data = file_info['data']
+
+            if file_data:
                 download_url = file_data.get('downloadUrl')
                 filename = file_data.get('fileName', f"{mod_name}.jar")
                 if download_url:
@@ -263,243 +470,349 @@ class DownloadManager:
 
         return None
 
+    def _resolve_inputs(self, mod: dict) -> dict:
+        """Everything resolving a mod depends on, to tell whether an earlier result still applies"""
+        source = mod.get('source', 'modrinth')
+        source_config = self.mappings.get('sources', {}).get(source) or {}
+        project_mappings = source_config.get('project_mappings') or {}
+        return {
+            'source': source,
+            'version': mod.get('version'),
+            'environment': mod.get('environment', 'both'),
+            'slug': mod.get('slug'),
+            'project_mapping': project_mappings.get(mod.get('name')) if isinstance(project_mappings, dict) else None,
+            'project_id': mod.get('project_id'),
+            'file_id': mod.get('file_id'),
+            'download_url': mod.get('download_url'),
+            'target_dir': source_config.get('target_dir'),
+            'minecraft_version': self.minecraft_version,
+        }
+
+    def _resolve_mod(self, mod: dict) -> Tuple[Optional[dict], str]:
+        """
+        Resolve the download of a single mod
+        Returns: (download list entry or None, status message)
+        """
+        mod_name = mod.get('name')
+        version = mod.get('version')
+        source = mod.get('source', 'modrinth')
+        slug = mod.get('slug')  # Optional slug override
+        environment = mod.get('environment', 'both')  # client, server, or both
+
+        env_info = f" [{environment}]" if environment != 'both' else ""
+
+        # Check if version is missing
+        if not version:
+            return None, "✗ Missing version (run validation script first)"
+
+        # Skip the API lookup if the cached entry was resolved from the same inputs and is already on disk
+        inputs = self._resolve_inputs(mod)
+        previous = self.cache.get('downloads', {}).get(f'mod_{mod_name}')
+        if previous and previous.get('resolved_from') == inputs and self._is_up_to_date(previous):
+            self._verified_mods.add(mod_name)
+            return previous, f"✓ {previous['filename']}{env_info} (up to date)"
+
+        result = None
+        resolved_slug = None
+        size = None
+        sha1 = None
+
+        if source == 'modrinth':
+            modrinth_result = self._resolve_modrinth_url(mod_name, version, slug)
+            if modrinth_result:
+                url, filename, resolved_slug, size, sha1 = modrinth_result
+                result = (url, filename)
+        elif source == 'curseforge':
+            project_id = mod.get('project_id')
+            file_id = mod.get('file_id')
+            if not project_id:
+                return None, "✗ Missing project_id"
+            curseforge_result = self._resolve_curseforge_url(mod_name, version, project_id, file_id)
+            if curseforge_result:
+                url, filename = curseforge_result
+                result = (url, filename)
+                resolved_slug = f"cf_{project_id}"  # Use project_id as slug for CurseForge
+        elif source == 'custom':
+            result = self._resolve_custom_url(mod)
+
+        if not result:
+            return None, "✗ Failed"
+
+        url, filename = result
+        base_target_dir = self.mappings['sources'][source]['target_dir']
+
+        # Determine destinations based on environment
+        destinations = []
+        if environment in ['server', 'both']:
+            destinations.append(os.path.join(base_target_dir, filename))
+        if environment in ['client', 'both']:
+            client_dir = os.path.join(base_target_dir, 'client')
+            destinations.append(os.path.join(client_dir, filename))
+
+        entry = {
+            'type': 'mod',
+            'name': mod_name,
+            'version': version,
+            'url': url,
+            'filename': filename,
+            'target_dir': base_target_dir,
+            'environment': environment,
+            'destinations': destinations,  # Multiple destinations for 'both'
+            'slug': resolved_slug,  # Store for reference
+            'size': size,
+            'sha1': sha1,  # Lets later runs skip files that are already downloaded
+            'resolved_from': inputs
+        }
+        return entry, f"✓ {filename}{env_info}"
+
     def build_download_list(self) -> Dict[str, dict]:
         """Build list of files to download by resolving URLs"""
-        print("\n" + "="*70)
-        print("BUILDING DOWNLOAD LIST")
-        print("="*70)
+        logger.info("\n%s", SEPARATOR)
+        logger.info("BUILDING DOWNLOAD LIST")
+        logger.info(SEPARATOR)
 
         downloads = {}
-
-        # Minecraft server
         minecraft_config = self.config.get('minecraft', {})
-        if minecraft_config:
-            version = minecraft_config.get('version')
-            source = minecraft_config.get('source', 'mojang')
-
-            print(f"\nResolving Minecraft {version}...")
-            result = self._resolve_minecraft_url(version)
-            if result:
-                url, filename = result
-                target_dir = self.mappings['sources'][source]['target_dir']
-                downloads['minecraft'] = {
-                    'type': 'minecraft',
-                    'name': 'Minecraft Server',
-                    'version': version,
-                    'url': url,
-                    'filename': filename,
-                    'target_dir': target_dir,
-                    'destination': os.path.join(target_dir, filename)
-                }
-                print(f"  ✓ Found: {filename}")
-            else:
-                print(f"  ✗ Failed to resolve Minecraft {version}")
-
-        # Fabric loader
-        fabric_config = self.config.get('fabric', {})
-        if fabric_config:
-            version = fabric_config.get('version')
-            source = fabric_config.get('source', 'fabric')
-
-            print(f"\nResolving Fabric {version}...")
-            result = self._resolve_fabric_url(self.minecraft_version, version)
-            if result:
-                url, filename = result
-                target_dir = self.mappings['sources'][source]['target_dir']
-                downloads['fabric'] = {
-                    'type': 'fabric',
-                    'name': 'Fabric Loader',
-                    'version': version,
-                    'url': url,
-                    'filename': filename,
-                    'target_dir': target_dir,
-                    'destination': os.path.join(target_dir, filename)
-                }
-                print(f"  ✓ Found: {filename}")
-            else:
-                print(f"  ✗ Failed to resolve Fabric {version}")
-
-        # Mods
         mods_config = self.config.get('mods', [])
-        if mods_config:
-            print(f"\nResolving {len(mods_config)} mods...")
-
-            for mod in mods_config:
-                mod_name = mod.get('name')
-                version = mod.get('version')
-                source = mod.get('source', 'modrinth')
-                slug = mod.get('slug')  # Optional slug override
-                environment = mod.get('environment', 'both')  # client, server, or both
-
-                print(f"  [{mod_name}] ", end='')
-
-                # Check if version is missing
-                if not version:
-                    print(f"✗ Missing version (run validation script first)")
-                    continue
-
-                result = None
-                resolved_slug = None
-
-                if source == 'modrinth':
-                    modrinth_result = self._resolve_modrinth_url(mod_name, version, slug)
-                    if modrinth_result:
-                        url, filename, resolved_slug = modrinth_result
-                        result = (url, filename)
-                elif source == 'curseforge':
-                    project_id = mod.get('project_id')
-                    file_id = mod.get('file_id')
-                    if project_id:
-                        curseforge_result = self._resolve_curseforge_url(mod_name, version, project_id, file_id)
-                        if curseforge_result:
-                            url, filename = curseforge_result
-                            result = (url, filename)
-                            resolved_slug = f"cf_{project_id}"  # Use project_id as slug for CurseForge
-                    else:
-                        print(f"✗ Missing project_id")
-                        continue
-                elif source == 'custom':
-                    result = self._resolve_custom_url(mod)
 
+        # Pinned CurseForge files are looked up in one request instead of one per mod
+        self._prefetch_curseforge_files(mods_config)
+
+        # Resolution is I/O bound, so the Minecraft server and all mods are resolved
+        # concurrently while the results are reported in config order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if minecraft_config:
+                minecraft_future = executor.submit(self._resolve_minecraft_url, minecraft_config.get('version'))
+            mod_results = executor.map(self._resolve_mod, mods_config)
+
+            # Minecraft server
+            if minecraft_config:
+                version = minecraft_config.get('version')
+                source = minecraft_config.get('source', 'mojang')
+
+                logger.info("\nResolving Minecraft %s...", version)
+                result = minecraft_future.result()
+                if result:
+                    url, filename, size, sha1 = result
+                    target_dir = self.mappings['sources'][source]['target_dir']
+                    downloads['minecraft'] = {
+                        'type': 'minecraft',
+                        'name': 'Minecraft Server',
+                        'version': version,
+                        'url': url,
+                        'filename': filename,
+                        'target_dir': target_dir,
+                        'destination': os.path.join(target_dir, filename),
+                        'size': size,
+                        'sha1': sha1
+                    }
+                    logger.info("  ✓ Found: %s", filename)
+                else:
+                    logger.error("  ✗ Failed to resolve Minecraft %s", version)
+
+            # Fabric loader
+            fabric_config = self.config.get('fabric', {})
+            if fabric_config:
+                version = fabric_config.get('version')
+                source = fabric_config.get('source', 'fabric')
+
+                logger.info("\nResolving Fabric %s...", version)
+                result = self._resolve_fabric_url(self.minecraft_version, version)
                 if result:
                     url, filename = result
-                    base_target_dir = self.mappings['sources'][source]['target_dir']
-
-                    # Determine destinations based on environment
-                    destinations = []
-                    if environment in ['server', 'both']:
-                        destinations.append(os.path.join(base_target_dir, filename))
-                    if environment in ['client', 'both']:
-                        client_dir = os.path.join(base_target_dir, 'client')
-                        destinations.append(os.path.join(client_dir, filename))
-
-                    downloads[f'mod_{mod_name}'] = {
-                        'type': 'mod',
-                        'name': mod_name,
+                    target_dir = self.mappings['sources'][source]['target_dir']
+                    downloads['fabric'] = {
+                        'type': 'fabric',
+                        'name': 'Fabric Loader',
                         'version': version,
                         'url': url,
                         'filename': filename,
-                        'target_dir': base_target_dir,
-                        'environment': environment,
-                        'destinations': destinations,  # Multiple destinations for 'both'
-                        'slug': resolved_slug  # Store for reference
+                        'target_dir': target_dir,
+                        'destination': os.path.join(target_dir, filename)
                     }
-                    env_info = f" [{environment}]" if environment != 'both' else ""
-                    print(f"✓ {filename}{env_info}")
+                    logger.info("  ✓ Found: %s", filename)
                 else:
-                    print(f"✗ Failed")
+                    logger.error("  ✗ Failed to resolve Fabric %s", version)
 
-        print(f"\n{'─'*70}")
-        print(f"Total items resolved: {len(downloads)}")
+            # Mods
+            if mods_config:
+                logger.info("\nResolving %s mods...", len(mods_config))
+
+                for mod, (entry, message) in zip(mods_config, mod_results):
+                    mod_name = mod.get('name')
+                    logger.info("  [%s] %s", mod_name, message)
+                    if entry:
+                        downloads[f'mod_{mod_name}'] = entry
+
+        logger.info("\n%s", THIN_SEPARATOR)
+        logger.info("Total items resolved: %s", len(downloads))
         return downloads
 
+    def _is_up_to_date(self, item: dict) -> bool:
+        """Check whether all destinations of a mod already hold the file with the expected SHA-1"""
+        sha1 = item.get('sha1')
+        destinations = item.get('destinations')
+        if not sha1 or not destinations:
+            return False
+
+        # A size mismatch is found with a stat, without hashing the files
+        size = item.get('size')
+        if size is not None and any(_file_size(dest) != size for dest in destinations):
+            return False
+        return all(_file_sha1(dest) == sha1 for dest in destinations)
+
+    def _download_item(self, item: dict) -> Tuple[bool, List[str]]:
+        """
+        Download a single item of the download list
+        Returns: (success, output lines)
+        """
+        log = []
+        env_info = f" [{item.get('environment', 'both')}]" if item.get('environment') != 'both' else ""
+        log.append(f"\n[{item['name']} {item['version']}]{env_info}")
+
+        # Handle mods with multiple destinations (client/server/both)
+        if item.get('type') == 'mod' and 'destinations' in item:
+            destinations = item['destinations']
+            slug = item.get('slug')
+
+            # Files reused while resolving were hashed then already
+            if item['name'] in self._verified_mods or self._is_up_to_date(item):
+                log.append(f"  ✓ Up to date (SHA-1 matches), skipping download")
+                return True, log
+
+            # Remove old versions from all destination directories
+            if slug:
+                for dest in destinations:
+                    if os.path.exists(dest):
+                        old_size = os.path.getsize(dest)
+                        log.append(f"  ℹ Removing old version: {dest} ({old_size:,} bytes)")
+                        try:
+                            os.remove(dest)
+                        except Exception as e:
+                            log.append(f"  ⚠ Warning: Could not remove old file: {e}")
+
+            # Download to first destination
+            first_dest = destinations[0]
+            if not self._download_file(item['url'], first_dest, log, item.get('sha1')):
+                return False, log
+
+            # Copy to additional destinations if needed
+            for dest in destinations[1:]:
+                try:
+                    log.append(f"  ℹ Copying to: {dest}")
+                    self._ensure_dir(dest)
+                    shutil.copyfile(first_dest, dest)
+                except Exception as e:
+                    log.append(f"  ⚠ Warning: Could not copy to {dest}: {e}")
+            return True, log
+
+        # Handle non-mods with single destination
+        destination = item.get('destination')
+        if not destination:
+            log.append(f"  ✗ No destination specified")
+            return False, log
+
+        # Check if file already exists (with the expected size and SHA-1, if known)
+        file_size = _file_size(destination)
+        if file_size is not None:
+            if item.get('size') not in (None, file_size):
+                log.append(f"  ⚠ File exists with unexpected size ({file_size:,} bytes), downloading again")
+            elif item.get('sha1') and _file_sha1(destination) != item['sha1']:
+                log.append(f"  ⚠ File exists with unexpected SHA-1, downloading again")
+            else:
+                log.append(f"  ℹ File exists: {destination} ({file_size:,} bytes)")
+                log.append(f"  Skipping download")
+                return True, log
+
+        # Download the file
+        return self._download_file(item['url'], destination, log, item.get('sha1')), log
+
     def download_all(self, download_list: Optional[Dict[str, dict]] = None):
         """Download all files from the download list"""
         if download_list is None:
             download_list = self.build_download_list()
 
         if not download_list:
-            print("\n✗ No items to download")
+            logger.info("\n✗ No items to download")
             return
 
-        print("\n" + "="*70)
-        print("DOWNLOADING FILES")
-        print("="*70)
+        logger.info("\n%s", SEPARATOR)
+        logger.info("DOWNLOADING FILES")
+        logger.info(SEPARATOR)
 
         success_count = 0
         fail_count = 0
 
-        for key, item in download_list.items():
-            env_info = f" [{item.get('environment', 'both')}]" if item.get('environment') != 'both' else ""
-            print(f"\n[{item['name']} {item['version']}]{env_info}")
-
-            # Handle mods with multiple destinations (client/server/both)
-            if item.get('type') == 'mod' and 'destinations' in item:
-                destinations = item['destinations']
-                slug = item.get('slug')
-
-                # Remove old versions from all destination directories
-                if slug:
-                    for dest in destinations:
-                        if os.path.exists(dest):
-                            old_size = os.path.getsize(dest)
-                            print(f"  ℹ Removing old version: {dest} ({old_size:,} bytes)")
-                            try:
-                                os.remove(dest)
-                            except Exception as e:
-                                print(f"  ⚠ Warning: Could not remove old file: {e}")
-
-                # Download to first destination
-                first_dest = destinations[0]
-                if self._download_file(item['url'], first_dest):
-                    # Copy to additional destinations if needed
-                    for dest in destinations[1:]:
-                        try:
-                            print(f"  ℹ Copying to: {dest}")
-                            shutil.copy2(first_dest, dest)
-                        except Exception as e:
-                            print(f"  ⚠ Warning: Could not copy to {dest}: {e}")
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-            # Handle non-mods with single destination
-            else:
-                destination = item.get('destination')
-                if not destination:
-                    print(f"  ✗ No destination specified")
-                    fail_count += 1
-                    continue
-
-                # Check if file already exists
-                if os.path.exists(destination):
-                    file_size = os.path.getsize(destination)
-                    print(f"  ℹ File exists: {destination} ({file_size:,} bytes)")
-                    print(f"  Skipping download")
-                    success_count += 1
-                    continue
-
-                # Download the file
-                if self._download_file(item['url'], destination):
+        # Downloads are I/O bound, run them concurrently and print each item's
+        # output in list order once it is done
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for success, log in executor.map(self._download_item, download_list.values()):
+                logger.info("\n".join(log))
+                if success:
                     success_count += 1
                 else:
                     fail_count += 1
 
         # Save the download list as cache
+        # Drop conditional request entries that haven't been used for a while
+        cutoff = time.time() - HTTP_CACHE_MAX_AGE
+        self.http_cache = {url: entry for url, entry in self.http_cache.items()
+                           if entry.get('used', 0) >= cutoff}
         self.cache = {
             'minecraft_version': self.minecraft_version,
-            'downloads': download_list
+            'config_hash': self.config_hash,
+            'downloads': download_list,
+            'server_urls': self.server_urls,
+            'http_cache': self.http_cache
         }
         self._save_cache()
 
-        print("\n" + "="*70)
-        print(f"Download Summary: {success_count} successful, {fail_count} failed")
-        print("="*70)
+        logger.info("\n%s", SEPARATOR)
+        logger.info("Download Summary: %s successful, %s failed", success_count, fail_count)
+        logger.info(SEPARATOR)
 
     def download_from_cache(self):
         """Download files using cached download list"""
         if not self.cache or 'downloads' not in self.cache:
-            print("\n✗ No valid cache found. Building download list...")
+            logger.info("\n✗ No valid cache found. Building download list...")
+            self.download_all()
+            return
+
+        if self.cache.get('config_hash') != self.config_hash:
+            logger.warning("\n⚠ Config or source mappings changed since the cache was built. Rebuilding download list...")
             self.download_all()
             return
 
         download_list = self.cache['downloads']
         cached_mc_version = self.cache.get('minecraft_version')
 
-        print("\n" + "="*70)
-        print("USING CACHED DOWNLOAD LIST")
-        print("="*70)
-        print(f"Cached MC version: {cached_mc_version}")
-        print(f"Current MC version: {self.minecraft_version}")
-        print(f"Total items: {len(download_list)}")
-
-        if cached_mc_version != self.minecraft_version:
-            print(f"\n⚠ Warning: Minecraft version mismatch!")
-            print(f"  Cache may be outdated. Consider rebuilding.")
+        logger.info("\n%s", SEPARATOR)
+        logger.info("USING CACHED DOWNLOAD LIST")
+        logger.info(SEPARATOR)
+        logger.info("Cached MC version: %s", cached_mc_version)
+        logger.info("Current MC version: %s", self.minecraft_version)
+        logger.info("Total items: %s", len(download_list))
 
         self.download_all(download_list)
 
 
+def _setup_logging() -> QueueListener:
+    """
+    Print log messages to stdout through a queue, so worker threads
+    never wait for console output
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, handler)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+
 def main():
     import argparse
 
@@ -529,27 +842,38 @@ def main():
         default='source_mappings.yaml',
         help='Path to source mappings file (default: source_mappings.yaml)'
     )
-
-    args = parser.parse_args()
-
-    print("="*70)
-    print("MINECRAFT SERVER DOWNLOAD MANAGER")
-    print("="*70)
-
-    manager = DownloadManager(
-        config_file=args.config,
-        mappings_file=args.mappings,
-        cache_file=args.cache_file
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=MAX_WORKERS,
+        help=f'Number of parallel lookups and downloads (default: {MAX_WORKERS}, 1 disables parallelism)'
     )
 
-    if args.rebuild_cache or not manager.cache:
-        print("\nMode: Building new download list")
-        manager.download_all()
-    else:
-        print("\nMode: Using cached download list")
-        manager.download_from_cache()
+    args = parser.parse_args()
+    listener = _setup_logging()
+
+    try:
+        logger.info(SEPARATOR)
+        logger.info("MINECRAFT SERVER DOWNLOAD MANAGER")
+        logger.info(SEPARATOR)
+
+        with DownloadManager(
+            config_file=args.config,
+            mappings_file=args.mappings,
+            cache_file=args.cache_file,
+            max_workers=args.jobs
+        ) as manager:
+            if args.rebuild_cache or not manager.cache:
+                logger.info("\nMode: Building new download list")
+                manager.download_all()
+            else:
+                logger.info("\nMode: Using cached download list")
+                manager.download_from_cache()
 
-    print()
+        logger.info("")
+    finally:
+        # Flush queued messages before exiting
+        listener.stop()
 
 
 if __name__ == '__main__':
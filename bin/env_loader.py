@@ -4,8 +4,18 @@ Simple .env file loader
 Loads environment variables from .env file without external dependencies
 """
 import os
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+# [export ]KEY=VALUE line with an optionally quoted value and an optional trailing comment
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?(?P<key>[A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"(?P<dq>[^"\n]*)"|'(?P<sq>[^'\n]*)'|(?P<raw>[^#\n]*?))[ \t]*(?:#[^\n]*)?$"""
+)
+
+# Parsed .env files keyed by absolute path, with the mtime they were parsed at
+_ENV_CACHE: Dict[str, Tuple[int, Dict[str, str]]] = {}
 
 
 def load_env_file(env_file: str = ".env") -> Dict[str, str]:
@@ -18,39 +28,46 @@ def load_env_file(env_file: str = ".env") -> Dict[str, str]:
     Returns:
         Dictionary of environment variables loaded from file
     """
-    env_vars = {}
-
     # Check if file exists
-    if not os.path.exists(env_file):
-        return env_vars
+    try:
+        mtime = os.stat(env_file).st_mtime_ns
+    except OSError:
+        return {}
+
+    # Reuse the parsed file as long as it hasn't been modified
+    path = os.path.abspath(env_file)
+    cached = _ENV_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _ENV_CACHE[path] = (mtime, _parse_env_file(env_file))
+
+    # Callers get their own copy, so they can't modify the cached values
+    return dict(cached[1])
+
+
+def _parse_env_file(env_file: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines of a .env file"""
+    env_vars = {}
 
     try:
         with open(env_file, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
                 # Skip empty lines and comments
-                line = line.strip()
-                if not line or line.startswith('#'):
+                stripped = line.strip()
+                if not stripped or stripped.startswith('#'):
                     continue
 
-                # Parse KEY=VALUE format
-                if '=' in line:
-                    # Split on first = only
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-
-                    # Handle inline comments (after value)
-                    # But only if not within quotes
-                    if '#' in value and not ('"' in line or "'" in line):
-                        value = value.split('#')[0].strip()
+                # The line itself isn't printed, it may contain an API key
+                match = _ENV_LINE_RE.match(line)
+                if match is None:
+                    print(f"Warning: Ignoring line {line_num} of .env file '{env_file}', expected KEY=VALUE")
+                    continue
 
-                    env_vars[key] = value
+                value = match.group('dq')
+                if value is None:
+                    value = match.group('sq')
+                if value is None:
+                    value = match.group('raw')
+                env_vars[match.group('key')] = value
 
     except Exception as e:
         print(f"Warning: Error reading .env file '{env_file}': {e}")
@@ -90,6 +107,26 @@ def get_env(key: str, default: Optional[str] = None, env_file: str = ".env") ->
     return default
 
 
+def get_env_flag(key: str, default: bool = False, env_file: str = ".env") -> bool:
+    """
+    Get a boolean environment variable with .env file fallback
+
+    '1', 'true', 'yes' and 'on' (in any case) are true, any other value is false
+
+    Args:
+        key: Environment variable name
+        default: Value if the variable is not set
+        env_file: Path to .env file
+
+    Returns:
+        Whether the flag is set
+    """
+    value = get_env(key, None, env_file)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 def load_dotenv(env_file: str = ".env", override: bool = False):
     """
     Load .env file into os.environ (similar to python-dotenv)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Simple pooled HTTP client
+Keeps connections alive between requests without external dependencies
+"""
+import email.utils
+import gzip
+import http.client
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+
+class HttpResponse:
+    """Response of a completed HTTP request"""
+
+    def __init__(self, status: int, headers: http.client.HTTPMessage, data: bytes, url: str):
+        self.status = status
+        self.headers = headers
+        self.data = data
+        self.url = url
+
+
+class HttpPool:
+    """
+    Keeps idle keep-alive connections per host and hands them to whichever
+    thread requests that host next, so repeated requests to the same API skip
+    the TCP and TLS handshakes, also across thread pools
+    """
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    # Rate limits and temporary server errors worth retrying
+    RETRY_CODES = (429, 500, 502, 503, 504)
+    # Network errors that may succeed on another attempt. Invalid URLs, failed
+    # certificate checks and redirect loops fail the same way every time
+    RETRY_ERRORS = (ConnectionError, TimeoutError, socket.timeout,
+                    http.client.RemoteDisconnected, http.client.IncompleteRead)
+    MAX_RETRY_DELAY = 60.0
+    # Idle connections kept per host, more than that are closed when returned
+    MAX_IDLE_PER_HOST = 16
+
+    def __init__(self, timeout: float = 10.0, max_redirects: int = 5,
+                 retries: int = 0, backoff_factor: float = 0.5):
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # One TLS context for all connections, so the CA certificates are only loaded once
+        self._ssl_context = ssl.create_default_context()
+        self._lock = threading.Lock()
+        # Idle connections by (scheme, host), checked out for one request at a time
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _checkout(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Take an idle connection to a host, or open a new one"""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _checkin(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        """Return a connection after its response was read, keeping it for reuse if it is still open"""
+        if conn.sock is None:
+            return
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method: str, scheme: str, netloc: str, path: str,
+              headers: Dict[str, str], body: Optional[bytes]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a single request, reconnecting once if a kept-alive connection went stale"""
+        conn = self._checkout(scheme, netloc)
+        try:
+            for attempt in range(2):
+                reused = conn.sock is not None
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    response = conn.getresponse()
+                    data = response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                if data and (response.getheader('Content-Encoding') or '').lower() == 'gzip':
+                    data = gzip.decompress(data)
+                return response.status, response.headers, data
+        finally:
+            self._checkin(scheme, netloc, conn)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt, honoring a Retry-After header"""
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+            try:
+                retry_date = email.utils.parsedate_to_datetime(retry_after)
+                return min(max(retry_date.timestamp() - time.time(), 0.0), self.MAX_RETRY_DELAY)
+            except (TypeError, ValueError, AttributeError):
+                pass
+
+        # Exponential backoff with a little jitter
+        return min(self.backoff_factor * (2 ** attempt) + random.random() * 0.1, self.MAX_RETRY_DELAY)
+
+    def _request_once(self, method: str, url: str, headers: Dict[str, str],
+                      body: Optional[bytes]) -> HttpResponse:
+        """Perform a single request attempt, following redirects"""
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+
+            status, response_headers, data = self._send(method, parts.scheme, parts.netloc, path, headers, body)
+
+            location = response_headers.get('Location')
+            if status in self.REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                if status == 303:
+                    method, body = 'GET', None
+                continue
+
+            return HttpResponse(status, response_headers, data, url)
+
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                body: Optional[bytes] = None) -> HttpResponse:
+        """
+        Perform an HTTP request and read the whole response body
+        Redirects are followed. Network errors and rate limited / temporarily
+        failing requests are retried up to `retries` times with exponential
+        backoff. Network errors left after that, and errors that retrying
+        can't fix, are raised. HTTP error statuses are returned like any
+        other response.
+        Responses are requested gzip compressed unless the caller sets
+        Accept-Encoding, and are returned decompressed.
+        """
+        headers = dict(headers or {})
+        if not any(name.lower() == 'accept-encoding' for name in headers):
+            headers['Accept-Encoding'] = 'gzip'
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self._request_once(method, url, headers, body)
+            except self.RETRY_ERRORS:
+                if attempt >= self.retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status in self.RETRY_CODES and attempt < self.retries:
+                time.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                continue
+
+            return response
+
+    def close(self):
+        """Close all idle connections of the pool"""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
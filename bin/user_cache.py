@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Per-user cache directories
+Cached API responses are trusted when they are read back, so they are kept
+in a directory only the current user can write to
+"""
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+APP_NAME = 'urban-realms'
+
+
+def _cache_root() -> Path:
+    """Base directory for per-user caches ($XDG_CACHE_HOME or ~/.cache, %LOCALAPPDATA% on Windows)"""
+    base = os.environ.get('LOCALAPPDATA' if sys.platform == 'win32' else 'XDG_CACHE_HOME')
+    if base and os.path.isabs(base):
+        return Path(base)
+    return Path.home() / '.cache'
+
+
+@lru_cache(maxsize=None)
+def private_cache_dir(name: str) -> Optional[Path]:
+    """
+    Create (if needed) a cache directory that only the current user can access
+
+    Args:
+        name: Subdirectory for one script's cache
+
+    Returns:
+        The directory, or None if it can't be created or belongs to another user
+    """
+    path = _cache_root() / APP_NAME / name
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if hasattr(os, 'getuid'):
+            info = path.stat()
+            if info.st_uid != os.getuid():
+                return None
+            if info.st_mode & 0o077:
+                path.chmod(0o700)
+    except OSError:
+        return None
+    return path
@@ -5,17 +5,38 @@ Validates format and checks if specified versions exist on their sources.
 Auto-updates config with latest compatible versions when version not found.
 """
 import os
+import shutil
 import sys
 import json
+import hashlib
+import http.client
+import logging
+import tempfile
+import threading
+import time
+import urllib.parse
 import yaml
-import urllib.request
-import urllib.error
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add bin directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from env_loader import load_dotenv, get_env
+from env_loader import load_dotenv, get_env_flag
+from http_pool import HttpPool, HttpResponse
+from user_cache import private_cache_dir
+
+# Use the libyaml based loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# orjson parses API responses (notably the Mojang version manifest) considerably faster when installed
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps
+except ImportError:
+    from json import loads as json_loads
+    orjson_dumps = None
 
 # Load .env file if it exists
 load_dotenv()
@@ -27,13 +48,131 @@ if sys.platform == 'win32':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Print API request details (set VALIDATE_DEBUG=1, or pass --verbose)
+DEBUG = get_env_flag('VALIDATE_DEBUG')
+
+logger = logging.getLogger(__name__)
+
+# Concurrent mod validations (kept low to stay within Modrinth's rate limits)
+MAX_WORKERS = 8
+
+# On-disk API response cache (a private per-user directory, see user_cache),
+# revalidated with ETag/Last-Modified once stale
+CACHE_NAME = 'validate_config'
+CACHE_TTL = 600
+
+# A config that passed validation is not checked again for this many seconds unless it changes
+STATE_FILE_NAME = '.validate_config.state'
+STATE_TTL = 3600
+
+# Projects fetched per Modrinth /projects or CurseForge /mods bulk request
+PROJECTS_BATCH_SIZE = 100
+
+# Mod environment by Modrinth (client_side, server_side) support, anything else is 'both'
+_ENV_TABLE = {
+    ('required', 'required'): 'both',
+    ('required', 'optional'): 'both',
+    ('optional', 'required'): 'both',
+    ('optional', 'optional'): 'both',
+    ('required', 'unsupported'): 'client',
+    ('optional', 'unsupported'): 'client',
+    ('unsupported', 'required'): 'server',
+    ('unsupported', 'optional'): 'server',
+}
+
+
+# Messages for each reason a configured CurseForge version is rejected
+_CURSEFORGE_REJECTIONS = {
+    'not_found': {
+        'problem': "VERSION NOT FOUND: {version}",
+        'fix': "latest version",
+        'note': "",
+        'no_fix': "Mod '{mod_name}': version '{version}' not found and no compatible version available",
+        'error': "Mod '{mod_name}': version '{version}' not found on CurseForge",
+    },
+    'loader': {
+        'problem': "VERSION FOUND but not for Fabric loader",
+        'fix': "latest Fabric version",
+        'note': "Fabric, ",
+        'no_fix': "Mod '{mod_name}': version '{version}' not available for Fabric loader",
+        'error': "Mod '{mod_name}' version '{version}' not available for Fabric loader",
+    },
+    'mc_version': {
+        'problem': "VERSION FOUND but not for MC {mc}",
+        'fix': "version for MC {mc}",
+        'note': "MC {mc}, ",
+        'no_fix': "Mod '{mod_name}': version '{version}' not available for Minecraft {mc}",
+        'error': "Mod '{mod_name}' version '{version}' not available for Minecraft {mc}",
+    },
+}
+
+# Line width for the saved config, large enough that long values (e.g. URLs) are never wrapped.
+# libyaml rejects float('inf'), so use the largest width it accepts
+YAML_WIDTH = 2 ** 31 - 1
+
+# Key order of mod entries written back to the config, other keys follow in their original order
+MOD_KEY_ORDER = ('name', 'project_id', 'version', 'file_id', 'source', 'slug', 'download_url', 'environment')
+
+
+def _ordered_mod(mod: dict) -> dict:
+    """Copy of a mod entry with its keys in MOD_KEY_ORDER"""
+    ordered = {key: mod[key] for key in MOD_KEY_ORDER if key in mod}
+    for key, value in mod.items():
+        if key not in ordered:
+            ordered[key] = value
+    return ordered
+
+
+def _project_url(template: str) -> Callable[[object], str]:
+    """
+    Build a project URL from a template with a single {project_id} placeholder
+    The template is split once, so building a URL for each mod is just a concatenation
+    """
+    head, placeholder, tail = template.partition('{project_id}')
+    if not placeholder or '{' in head + tail:
+        return lambda project_id: template.format(project_id=project_id)
+    return lambda project_id: f"{head}{project_id}{tail}"
+
+
+def _infer_env(project_info: Optional[dict]) -> str:
+    """Environment (client/server/both) of a Modrinth project"""
+    if not project_info:
+        return 'both'
+    return _ENV_TABLE.get((project_info.get('client_side', 'required'),
+                           project_info.get('server_side', 'required')), 'both')
+
+
+class _BufferHandler(logging.Handler):
+    """
+    Write log messages to stdout, or into the output buffer of the mod being
+    validated when the record carries one (see ConfigValidator._debug)
+    """
+
+    def emit(self, record: logging.LogRecord):
+        message = self.format(record)
+        buffer = getattr(record, 'buffer', None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer['output'].append(message)
+
+
+def _setup_logging(level: int):
+    """Print this script's log messages through _BufferHandler"""
+    handler = _BufferHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
 
 class ConfigValidator:
     """Validates config.yaml structure and version availability"""
 
     def __init__(self, config_file: str = "config.yaml",
                  mappings_file: str = "source_mappings.yaml",
-                 auto_fix: bool = False):
+                 auto_fix: bool = False, use_cache: bool = True,
+                 max_workers: int = MAX_WORKERS):
         self.config_file = config_file
         self.mappings_file = mappings_file
         self.auto_fix = auto_fix
@@ -45,12 +184,88 @@ class ConfigValidator:
         self.updates_made = []
         self.config_modified = False
         self.curseforge_api_key = os.environ.get('CURSEFORGE_API_KEY')
+        # Keep-alive connections shared by all API requests
+        self._http = HttpPool(timeout=30, retries=3)
+        self.use_cache = use_cache
+        self.max_workers = max(1, max_workers)
+        # Responses already loaded during this run and fetches in progress, keyed by cache key
+        self._json_cache: Dict[str, object] = {}
+        self._pending_json: Dict[str, Future] = {}
+        self._json_lock = threading.Lock()
+        # Remembers the last config that passed validation
+        self.state_file = os.path.join(os.path.dirname(os.path.abspath(config_file)), STATE_FILE_NAME)
+        # Hashes of mods that passed validation (see _hash_mod) and when, and the
+        # indexes of config mods among them that are not validated again
+        self._validated_mods: Dict[str, float] = {}
+        self._unchanged_mods = set()
+        # Source settings looked up once the mappings are loaded (see _prepare_sources)
+        self._modrinth_config: dict = {}
+        self._modrinth_project_mappings: dict = {}
+        self._modrinth_headers: Dict[str, str] = {}
+        self._curseforge_config: dict = {}
+        self._curseforge_headers: Dict[str, str] = {}
+        self._modrinth_versions_base: Callable[[object], str] = _project_url('')
+        self._curseforge_mod_info_url: Callable[[object], str] = _project_url('')
+        self._curseforge_files_url: Callable[[object], str] = _project_url('')
+        # Modrinth projects loaded in bulk, keyed by lowercased slug and by project ID
+        self._modrinth_projects: Dict[str, dict] = {}
+        # CurseForge mod info responses loaded in bulk, keyed by project ID
+        self._curseforge_mods: Dict[int, dict] = {}
+        # CurseForge files pinned with a file_id, loaded in bulk and keyed by file ID
+        self._curseforge_files: Dict[str, dict] = {}
+        # Latest compatible CurseForge file found per project ID during this run
+        self._curseforge_latest: Dict[str, Optional[Tuple[str, str, int]]] = {}
+        # Per-thread buffers for output and results of the mod being validated
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close pooled API connections"""
+        self._http.close()
+
+    def _out(self, message: str):
+        """Print a message, or buffer it while mods are validated concurrently"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer['output'].append(message)
+
+    def _debug(self, message: str, *args):
+        """Log a debug message, into the current mod's output buffer if there is one"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, *args, extra={'buffer': getattr(self._local, 'buffer', None)})
+
+    def _record(self, kind: str, message: str):
+        """Record an error, warning or update, buffered per mod while mods are validated concurrently"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            getattr(self, kind).append(message)
+        else:
+            buffer[kind].append(message)
+
+    def _error(self, message: str):
+        """Record a validation error"""
+        self._record('errors', message)
+
+    def _warning(self, message: str):
+        """Record a validation warning"""
+        self._record('warnings', message)
+
+    def _update(self, message: str):
+        """Record a modification made to the config"""
+        self._record('updates_made', message)
 
     def _load_yaml(self, file_path: str) -> Optional[dict]:
         """Load YAML configuration file"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
             self.errors.append(f"File not found: {file_path}")
             return None
@@ -60,44 +275,271 @@ class ConfigValidator:
 
     def _save_yaml(self):
         """Save modified config back to file"""
+        # Fields added by auto-fix are appended to the mod entries, give them a stable order
+        mods = self.config.get('mods')
+        if isinstance(mods, list):
+            self.config['mods'] = [_ordered_mod(mod) if isinstance(mod, dict) else mod for mod in mods]
+
+        # Write next to the config and swap it in, so a crash never leaves a truncated config behind
+        target = os.path.realpath(self.config_file)
+        tmp_path = None
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                yaml.dump(self.config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True,
+                          sort_keys=False, width=YAML_WIDTH, encoding='utf-8')
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file private, keep the permissions of the existing config
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
             print(f"\n✓ Config file updated: {self.config_file}")
             return True
         except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             print(f"\n✗ Failed to save config file: {e}")
             return False
 
-    def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None,
-                    debug: bool = False) -> Optional[dict]:
-        """Fetch JSON data from URL"""
+    def _hash_config(self) -> Optional[str]:
+        """Hash the contents of the config and mappings files, None if they cannot be read"""
+        digest = hashlib.blake2b()
         try:
-            req = urllib.request.Request(url)
-            if headers:
-                for key, value in headers.items():
-                    req.add_header(key, value)
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                data = response.read()
-                if debug:
-                    print(f"  DEBUG: HTTP {response.status} - Response length: {len(data)} bytes")
-                return json.loads(data)
-        except urllib.error.HTTPError as e:
-            if debug:
-                print(f"  DEBUG: HTTP Error {e.code}: {e.reason}")
-                try:
-                    error_body = e.read().decode('utf-8')
-                    print(f"  DEBUG: Error response: {error_body[:500]}")
-                except:
-                    pass
-            if e.code == 404:
-                return None
+            for file_path in (self.config_file, self.mappings_file):
+                with open(file_path, 'rb') as f:
+                    digest.update(f.read())
+                digest.update(b'\0')
+        except OSError:
             return None
-        except Exception as e:
-            if debug:
-                print(f"  DEBUG: Exception: {type(e).__name__}: {e}")
+        return digest.hexdigest()
+
+    def _read_state(self) -> dict:
+        """Load the state of earlier validations, empty if there is none"""
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _recently_validated(self) -> bool:
+        """Check whether the config passed validation within STATE_TTL and has not changed since"""
+        state = self._read_state()
+        if time.time() - state.get('validated_at', 0) >= STATE_TTL:
+            return False
+        config_hash = self._hash_config()
+        return config_hash is not None and state.get('config_hash') == config_hash
+
+    def _hash_mod(self, mod: dict) -> str:
+        """Hash a mod entry together with everything else its validation depends on"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([mod, self.minecraft_version, self.mappings],
+                                 sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _load_validated_mods(self):
+        """Remember which mods passed validation within STATE_TTL and are unchanged since"""
+        validated_mods = self._read_state().get('mods')
+        if not isinstance(validated_mods, dict):
+            return
+        expiry = time.time() - STATE_TTL
+        self._validated_mods = {mod_hash: validated_at for mod_hash, validated_at in validated_mods.items()
+                                if isinstance(validated_at, (int, float)) and validated_at > expiry}
+        self._unchanged_mods = {i for mod, i in self._mod_tasks() if self._hash_mod(mod) in self._validated_mods}
+
+    def _save_state(self, config_valid: bool):
+        """
+        Remember the mods that passed validation and, if everything passed,
+        the config as a whole (best effort)
+        Args:
+            config_valid: The whole config passed validation
+        """
+        state = {'validated_at': time.time(), 'mods': self._validated_mods}
+        if config_valid:
+            config_hash = self._hash_config()
+            if config_hash is not None:
+                state['config_hash'] = config_hash
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _cache_key(url: str, headers: Optional[Dict[str, str]]) -> str:
+        """Cache key for a request, covering the URL and all request headers"""
+        key = url
+        for name, value in sorted((headers or {}).items()):
+            key += f"\n{name}: {value}"
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _read_cache(self, key: str) -> Optional[dict]:
+        """Return the cached entry for a request key, if any"""
+        cache_dir = private_cache_dir(CACHE_NAME)
+        if cache_dir is None:
+            return None
+        try:
+            with open(cache_dir / (key + '.json'), 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, key: str, entry: dict):
+        """Store a cache entry on disk (best effort)"""
+        cache_dir = private_cache_dir(CACHE_NAME)
+        if cache_dir is None:
+            return
+        try:
+            # Write to a temporary file first so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            if orjson_dumps is not None:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson_dumps(entry))
+            else:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+            os.replace(tmp_path, cache_dir / (key + '.json'))
+        except OSError:
+            pass
+
+    def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[dict]:
+        """
+        Fetch JSON data from URL
+        Successful responses are kept for the rest of the run, and concurrent
+        requests for the same URL and headers share a single fetch.
+        """
+        key = self._cache_key(url, headers)
+        with self._json_lock:
+            if key in self._json_cache:
+                return self._json_cache[key]
+            pending = self._pending_json.get(key)
+            if pending is None:
+                pending = self._pending_json[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        try:
+            data = self._load_json(key, url, headers)
+            if data is not None:
+                self._json_cache[key] = data
+            pending.set_result(data)
+            return data
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._json_lock:
+                del self._pending_json[key]
+
+    def _load_json(self, key: str, url: str, headers: Optional[Dict[str, str]]) -> Optional[dict]:
+        """
+        Load JSON data from the disk cache or the network
+        Cached responses are used for CACHE_TTL seconds, after which they are
+        revalidated with a conditional request.
+        """
+        if not self.use_cache:
+            data, _ = self._request_json(url, headers)
+            return data
+
+        entry = self._read_cache(key)
+        if entry is not None and time.time() - entry.get('fetched_at', 0) < CACHE_TTL:
+            self._debug("  DEBUG: Using cached response")
+            return entry['body']
+
+        # Ask the server to only send the body if it changed since it was cached
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        data, response = self._request_json(url, request_headers)
+        if response is not None and response.status == 304 and entry is not None:
+            self._debug("  DEBUG: HTTP 304 - Cached response still valid")
+            data = entry['body']
+        elif data is None:
             return None
+        else:
+            entry = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body': data,
+            }
+
+        entry['fetched_at'] = time.time()
+        self._write_cache(key, entry)
+        return data
+
+    def _head_ok(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[bool]:
+        """
+        Check whether a URL exists with a HEAD request, without downloading the body
+        Returns:
+            True if it exists, False if the server reports it missing,
+            None for any other response. Network errors are raised.
+        """
+        response = self._http.request('HEAD', url, headers)
+        if 200 <= response.status < 300:
+            return True
+        if response.status in (404, 410):
+            return False
+        return None
+
+    def _request_json(self, url: str, headers: Optional[Dict[str, str]], method: str = 'GET',
+                      body: Optional[bytes] = None) -> Tuple[Optional[dict], Optional[HttpResponse]]:
+        """
+        Perform a request and decode its JSON body
+        Returns:
+            Tuple of (data, response), data is None if the request failed
+        """
+        try:
+            response = self._http.request(method, url, headers, body)
+        except Exception as e:
+            self._debug("  DEBUG: Exception: %s: %s", type(e).__name__, e)
+            return None, None
+
+        if response.status == 304:
+            return None, response
+
+        if not 200 <= response.status < 300:
+            self._debug("  DEBUG: HTTP Error %s: %s", response.status, http.client.responses.get(response.status, ''))
+            self._debug("  DEBUG: Error response: %s", response.data[:500].decode('utf-8', 'replace'))
+            return None, response
+
+        self._debug("  DEBUG: HTTP %s - Response length: %s bytes", response.status, len(response.data))
+        try:
+            return json_loads(response.data), response
+        except ValueError as e:
+            self._debug("  DEBUG: Exception: %s: %s", type(e).__name__, e)
+            return None, response
+
+    def _prepare_sources(self):
+        """Look up the source settings and request headers used for every mod"""
+        sources = self.mappings.get('sources', {}) or {}
+
+        self._modrinth_config = sources.get('modrinth') or {}
+        self._modrinth_project_mappings = self._modrinth_config.get('project_mappings') or {}
+        self._modrinth_headers = {
+            'User-Agent': self._modrinth_config.get('user_agent', 'minecraft-server-manager/1.0')
+        }
+        self._modrinth_versions_base = _project_url(self._modrinth_config.get('manifest_url', ''))
+
+        self._curseforge_config = sources.get('curseforge') or {}
+        self._curseforge_headers = {
+            'Accept': 'application/json',
+            'x-api-key': self.curseforge_api_key
+        }
+        self._curseforge_mod_info_url = _project_url(self._curseforge_config.get('mod_info_url', ''))
+        self._curseforge_files_url = _project_url(self._curseforge_config.get('files_url', ''))
+
+    def _modrinth_project_id(self, mod_name: str, slug: Optional[str] = None) -> str:
+        """Modrinth project ID/slug of a mod: mapping override, then config slug, then name"""
+        return self._modrinth_project_mappings.get(mod_name, slug or mod_name)
 
     def validate_structure(self) -> bool:
         """Validate basic YAML structure"""
@@ -114,6 +556,7 @@ class ConfigValidator:
         self.mappings = self._load_yaml(self.mappings_file)
         if not self.mappings:
             return False
+        self._prepare_sources()
 
         # Validate minecraft section
         if 'minecraft' not in self.config:
@@ -217,6 +660,8 @@ class ConfigValidator:
         source_config = self.mappings['sources']['mojang']
         manifest_url = source_config['manifest_url']
 
+        # Versions are only listed in the manifest (per-version URLs need its hashes),
+        # so it is fetched once and afterwards revalidated through the response cache
         manifest = self._fetch_json(manifest_url)
         if not manifest:
             self.errors.append("Failed to fetch Minecraft version manifest")
@@ -253,97 +698,195 @@ class ConfigValidator:
 
         # Make a HEAD request to check if it exists
         try:
-            req = urllib.request.Request(url, method='HEAD')
-            with urllib.request.urlopen(req, timeout=30) as response:
-                if response.status == 200:
-                    print(f"  ✓ Fabric {fabric_version} found for MC {self.minecraft_version}")
-                    return True
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                self.errors.append(f"Fabric version '{fabric_version}' not found for Minecraft {self.minecraft_version}")
-                print(f"  ✗ Fabric {fabric_version} NOT FOUND")
-                return False
+            exists = self._head_ok(url)
         except Exception as e:
             self.warnings.append(f"Could not verify Fabric version: {e}")
             print(f"  ⚠ Could not verify Fabric version: {e}")
             return True  # Don't fail validation if we can't check
 
-        return False
+        if exists:
+            print(f"  ✓ Fabric {fabric_version} found for MC {self.minecraft_version}")
+            return True
+        if exists is False:
+            self.errors.append(f"Fabric version '{fabric_version}' not found for Minecraft {self.minecraft_version}")
+            print(f"  ✗ Fabric {fabric_version} NOT FOUND")
+            return False
+
+        self.warnings.append("Could not verify Fabric version: unexpected response from Fabric meta")
+        print("  ⚠ Could not verify Fabric version: unexpected response from Fabric meta")
+        return True
+
+    def _prefetch_modrinth_projects(self, mods: List[dict]):
+        """
+        Load the projects of Modrinth mods with the bulk projects endpoint
+        Only mods that may need their environment looked up are included:
+        ones without an environment or version, or all of them in auto-fix mode.
+        """
+        project_ids = list(dict.fromkeys(
+            self._modrinth_project_id(mod['name'], mod.get('slug'))
+            for mod in mods
+            if mod.get('source', 'modrinth') == 'modrinth'
+            and (self.auto_fix or 'environment' not in mod or not mod.get('version'))
+        ))
+
+        for i in range(0, len(project_ids), PROJECTS_BATCH_SIZE):
+            batch = project_ids[i:i + PROJECTS_BATCH_SIZE]
+            ids_param = urllib.parse.quote(json.dumps(batch, separators=(',', ':')))
+            projects = self._fetch_json(f"{self._modrinth_config['api_base']}/projects?ids={ids_param}",
+                                        self._modrinth_headers)
+            for project in projects or []:
+                self._modrinth_projects[project.get('slug', '').lower()] = project
+                self._modrinth_projects[project.get('id')] = project
+
+    def _prefetch_curseforge_mods(self, mods: List[dict]):
+        """Load the mod info of all CurseForge mods with the bulk mods endpoint"""
+        if not self.curseforge_api_key:
+            return
+
+        project_ids = list(dict.fromkeys(
+            int(mod['project_id']) for mod in mods
+            if mod.get('source') == 'curseforge' and str(mod.get('project_id', '')).isdigit()
+        ))
+        # Without api_base the mod info is loaded per mod from mod_info_url instead
+        api_base = self._curseforge_config.get('api_base')
+        if not project_ids or not api_base:
+            return
+
+        url = f"{api_base}/mods"
+        headers = dict(self._curseforge_headers)
+        headers['Content-Type'] = 'application/json'
+        for i in range(0, len(project_ids), PROJECTS_BATCH_SIZE):
+            body = json.dumps({'modIds': project_ids[i:i + PROJECTS_BATCH_SIZE]}).encode()
+            response, _ = self._request_json(url, headers, 'POST', body)
+            for mod_data in (response or {}).get('data', []):
+                # Stored in the shape of a single mod info response
+                self._curseforge_mods[mod_data.get('id')] = {'data': mod_data}
+
+    def _get_curseforge_mod_info(self, project_id: int) -> Optional[dict]:
+        """Get a CurseForge mod info response, from the bulk prefetch when possible"""
+        if str(project_id).isdigit() and int(project_id) in self._curseforge_mods:
+            return self._curseforge_mods[int(project_id)]
+
+        mod_info_url = self._curseforge_mod_info_url(project_id)
+        return self._fetch_json(mod_info_url, self._curseforge_headers)
+
+    def _prefetch_curseforge_files(self, mods: List[dict]):
+        """Load all CurseForge files pinned with a file_id with the bulk files endpoint"""
+        if not self.curseforge_api_key:
+            return
+
+        file_ids = list(dict.fromkeys(
+            int(mod['file_id']) for mod in mods
+            if mod.get('source') == 'curseforge' and str(mod.get('file_id', '')).isdigit()
+        ))
+        # Without api_base pinned files are looked up in the project's files list instead
+        api_base = self._curseforge_config.get('api_base')
+        if not file_ids or not api_base:
+            return
+
+        url = f"{api_base}/mods/files"
+        headers = dict(self._curseforge_headers)
+        headers['Content-Type'] = 'application/json'
+        for i in range(0, len(file_ids), PROJECTS_BATCH_SIZE):
+            body = json.dumps({'fileIds': file_ids[i:i + PROJECTS_BATCH_SIZE]}).encode()
+            response, _ = self._request_json(url, headers, 'POST', body)
+            for file_data in (response or {}).get('data', []):
+                self._curseforge_files[str(file_data.get('id'))] = file_data
+
+    def _get_curseforge_file(self, project_id: int, file_id) -> Optional[dict]:
+        """Get a single CurseForge file of a project, from the bulk prefetch when possible"""
+        file_data = self._curseforge_files.get(str(file_id))
+        if file_data is None:
+            api_base = self._curseforge_config.get('api_base')
+            if not api_base:
+                # The pinned file is then looked up in the project's files list
+                self._debug("  DEBUG: sources.curseforge.api_base not set, can't load CurseForge file %s", file_id)
+                return None
+            file_info = self._fetch_json(f"{api_base}/mods/{project_id}/files/{file_id}",
+                                         self._curseforge_headers)
+            file_data = file_info.get('data') if file_info else None
+
+        # Only trust the file if it belongs to the configured project
+        if not file_data or str(file_data.get('modId')) != str(project_id):
+            return None
+        return file_data
+
+    def _prefetch_projects(self, mods: List[dict]):
+        """Bulk load Modrinth projects, CurseForge mod info and pinned CurseForge files needed to validate mods"""
+        self._prefetch_modrinth_projects(mods)
+        self._prefetch_curseforge_mods(mods)
+        self._prefetch_curseforge_files(mods)
+
+    def _modrinth_versions_url(self, project_id: str, compatible_only: bool = False) -> str:
+        """
+        URL of a Modrinth project's version list
+        Args:
+            compatible_only: Let Modrinth only list Fabric versions for our Minecraft version
+        """
+        url = self._modrinth_versions_base(project_id)
+        if compatible_only:
+            # Modrinth expects URL-encoded JSON arrays
+            loaders = urllib.parse.quote('["fabric"]')
+            game_versions = urllib.parse.quote(json.dumps([self.minecraft_version]))
+            url += ('&' if '?' in url else '?') + f"loaders={loaders}&game_versions={game_versions}"
+        return url
+
+    def _get_modrinth_project(self, project_id: str) -> Optional[dict]:
+        """Get Modrinth project info, from the bulk prefetch when possible"""
+        project = self._modrinth_projects.get(project_id) or self._modrinth_projects.get(str(project_id).lower())
+        if project is not None:
+            return project
+
+        return self._fetch_json(f"{self._modrinth_config['api_base']}/project/{project_id}", self._modrinth_headers)
 
     def _find_latest_modrinth_version(self, mod_name: str, project_id: str) -> Optional[Tuple[str, str]]:
         """
         Find the latest compatible version for a Modrinth mod
         Returns: (version_number, environment) or None
         """
-        source_config = self.mappings['sources']['modrinth']
-        manifest_url = source_config['manifest_url'].format(project_id=project_id)
-        headers = {'User-Agent': source_config.get('user_agent', 'minecraft-server-manager/1.0')}
-
-        versions = self._fetch_json(manifest_url, headers)
+        # Modrinth filters by loader and game version and lists the newest version first
+        versions = self._fetch_json(self._modrinth_versions_url(project_id, compatible_only=True),
+                                    self._modrinth_headers)
         if not versions:
             return None
 
-        # Find the latest version that matches our criteria
-        for ver_info in versions:
-            loaders = ver_info.get('loaders', []) or []
-            game_versions = ver_info.get('game_versions', []) or []
-
-            if 'fabric' in loaders and self.minecraft_version in game_versions:
-                version_number = ver_info.get('version_number')
-                # Get project info to determine environment (client/server/both)
-                project_info = self._fetch_json(
-                    f"{source_config['api_base']}/project/{project_id}",
-                    headers
-                )
-                environment = 'both'  # default
-                if project_info:
-                    client_side = project_info.get('client_side', 'required')
-                    server_side = project_info.get('server_side', 'required')
-
-                    if client_side in ['required', 'optional'] and server_side in ['required', 'optional']:
-                        environment = 'both'
-                    elif client_side in ['required', 'optional'] and server_side == 'unsupported':
-                        environment = 'client'
-                    elif server_side in ['required', 'optional'] and client_side == 'unsupported':
-                        environment = 'server'
-
-                return (version_number, environment)
+        version_number = versions[0].get('version_number')
+        # Get project info to determine environment (client/server/both)
+        project_info = self._get_modrinth_project(project_id)
+        environment = _infer_env(project_info)
 
-        return None
+        return (version_number, environment)
 
-    def _auto_resolve_modrinth_version(self, mod: dict, mod_index: int, mod_name: str,
+    def _auto_resolve_modrinth_version(self, mod: dict, mod_name: str,
                                        slug: Optional[str] = None) -> bool:
         """Auto-resolve and set latest Modrinth version when version field is missing"""
-        source_config = self.mappings['sources']['modrinth']
-
         # Determine project ID/slug
-        project_mappings = source_config.get('project_mappings', {}) or {}
-        project_id = project_mappings.get(mod_name, slug or mod_name)
+        project_id = self._modrinth_project_id(mod_name, slug)
 
         # Try to find latest version
         result = self._find_latest_modrinth_version(mod_name, project_id)
         if result:
             latest_version, environment = result
             env_display = f" [{environment}]" if environment != 'both' else ""
-            print(f"  [{mod_name}] → Resolved to latest version: {latest_version}{env_display}")
+            self._out(f"  [{mod_name}] → Resolved to latest version: {latest_version}{env_display}")
 
             # Update config
-            self.config['mods'][mod_index]['version'] = latest_version
-            self.config['mods'][mod_index]['environment'] = environment
-            self.updates_made.append(f"{mod_name}: resolved to latest version {latest_version} (environment={environment})")
+            mod['version'] = latest_version
+            mod['environment'] = environment
+            self._update(f"{mod_name}: resolved to latest version {latest_version} (environment={environment})")
             self.config_modified = True
             return True
         else:
-            self.errors.append(f"Mod '{mod_name}' (project: {project_id}) not found or no compatible version available on Modrinth")
-            print(f"  [{mod_name}] ✗ Could not find compatible version")
+            self._error(f"Mod '{mod_name}' (project: {project_id}) not found or no compatible version available on Modrinth")
+            self._out(f"  [{mod_name}] ✗ Could not find compatible version")
             return False
 
-    def _auto_resolve_curseforge_version(self, mod: dict, mod_index: int, mod_name: str,
+    def _auto_resolve_curseforge_version(self, mod: dict, mod_name: str,
                                          project_id: int) -> bool:
         """Auto-resolve and set latest CurseForge version when version field is missing"""
         if not self.curseforge_api_key:
-            self.errors.append(f"Mod '{mod_name}': CurseForge API key not set. Set CURSEFORGE_API_KEY environment variable.")
-            print(f"  [{mod_name}] ✗ CurseForge API key not set")
+            self._error(f"Mod '{mod_name}': CurseForge API key not set. Set CURSEFORGE_API_KEY environment variable.")
+            self._out(f"  [{mod_name}] ✗ CurseForge API key not set")
             return False
 
         # Try to find latest version
@@ -351,18 +894,18 @@ class ConfigValidator:
         if result:
             latest_version, environment, file_id = result
             env_display = f" [{environment}]" if environment != 'both' else ""
-            print(f"  [{mod_name}] → Resolved to latest version: {latest_version}{env_display}")
+            self._out(f"  [{mod_name}] → Resolved to latest version: {latest_version}{env_display}")
 
             # Update config
-            self.config['mods'][mod_index]['version'] = latest_version
-            self.config['mods'][mod_index]['file_id'] = file_id
-            self.config['mods'][mod_index]['environment'] = environment
-            self.updates_made.append(f"{mod_name}: resolved to latest version {latest_version} (file_id={file_id}, environment={environment})")
+            mod['version'] = latest_version
+            mod['file_id'] = file_id
+            mod['environment'] = environment
+            self._update(f"{mod_name}: resolved to latest version {latest_version} (file_id={file_id}, environment={environment})")
             self.config_modified = True
             return True
         else:
-            self.errors.append(f"Mod '{mod_name}' (project_id: {project_id}) not found or no compatible version available on CurseForge")
-            print(f"  [{mod_name}] ✗ Could not find compatible version")
+            self._error(f"Mod '{mod_name}' (project_id: {project_id}) not found or no compatible version available on CurseForge")
+            self._out(f"  [{mod_name}] ✗ Could not find compatible version")
             return False
 
     def validate_mod_version(self, mod: dict, mod_index: int) -> bool:
@@ -375,113 +918,83 @@ class ConfigValidator:
         if source == 'custom':
             # For custom sources, just check if download_url is present
             if 'download_url' in mod:
-                print(f"  [{mod_name}] ✓ Custom URL provided")
+                self._out(f"  [{mod_name}] ✓ Custom URL provided")
                 return True
             else:
-                print(f"  [{mod_name}] ✗ Missing download_url")
-                self.errors.append(f"Mod '{mod_name}' with source 'custom' missing download_url")
+                self._out(f"  [{mod_name}] ✗ Missing download_url")
+                self._error(f"Mod '{mod_name}' with source 'custom' missing download_url")
                 return False
 
         # If version is missing, try to auto-resolve latest version
         if not version:
-            print(f"  [{mod_name}] ⚠ No version specified, finding latest...")
+            self._out(f"  [{mod_name}] ⚠ No version specified, finding latest...")
             if source == 'modrinth':
-                return self._auto_resolve_modrinth_version(mod, mod_index, mod_name, slug)
+                return self._auto_resolve_modrinth_version(mod, mod_name, slug)
             elif source == 'curseforge':
                 project_id = mod.get('project_id')
                 if not project_id:
-                    self.errors.append(f"Mod '{mod_name}' with source 'curseforge' missing required field: 'project_id'")
-                    print(f"  [{mod_name}] ✗ Missing project_id")
+                    self._error(f"Mod '{mod_name}' with source 'curseforge' missing required field: 'project_id'")
+                    self._out(f"  [{mod_name}] ✗ Missing project_id")
                     return False
-                return self._auto_resolve_curseforge_version(mod, mod_index, mod_name, project_id)
+                return self._auto_resolve_curseforge_version(mod, mod_name, project_id)
             else:
-                self.errors.append(f"Mod '{mod_name}': version required for source '{source}'")
-                print(f"  [{mod_name}] ✗ Version required for source '{source}'")
+                self._error(f"Mod '{mod_name}': version required for source '{source}'")
+                self._out(f"  [{mod_name}] ✗ Version required for source '{source}'")
                 return False
 
         if source == 'modrinth':
-            return self._validate_modrinth_mod(mod, mod_index, mod_name, version, slug)
+            return self._validate_modrinth_mod(mod, mod_name, version, slug)
 
         if source == 'curseforge':
             project_id = mod.get('project_id')
             if not project_id:
-                self.errors.append(f"Mod '{mod_name}' with source 'curseforge' missing required field: 'project_id'")
-                print(f"  [{mod_name}] ✗ Missing project_id")
+                self._error(f"Mod '{mod_name}' with source 'curseforge' missing required field: 'project_id'")
+                self._out(f"  [{mod_name}] ✗ Missing project_id")
                 return False
-            return self._validate_curseforge_mod(mod, mod_index, mod_name, version, project_id)
+            return self._validate_curseforge_mod(mod, mod_name, version, project_id)
 
         # Other sources not implemented yet
-        self.warnings.append(f"Validation not implemented for source '{source}' (mod: {mod_name})")
-        print(f"  [{mod_name}] ⚠ Validation not implemented for source '{source}'")
+        self._warning(f"Validation not implemented for source '{source}' (mod: {mod_name})")
+        self._out(f"  [{mod_name}] ⚠ Validation not implemented for source '{source}'")
         return True  # Don't fail validation
 
-    def _validate_modrinth_mod(self, mod: dict, mod_index: int, mod_name: str,
+    def _validate_modrinth_mod(self, mod: dict, mod_name: str,
                                version: str, slug: Optional[str] = None) -> bool:
         """Validate a Modrinth mod version"""
-        source_config = self.mappings['sources']['modrinth']
-
         # Determine project ID/slug
-        project_mappings = source_config.get('project_mappings', {}) or {}
-        project_id = project_mappings.get(mod_name, slug or mod_name)
+        project_id = self._modrinth_project_id(mod_name, slug)
+
+        # Fetch the versions compatible with Fabric and our Minecraft version
+        compatible = self._fetch_json(self._modrinth_versions_url(project_id, compatible_only=True),
+                                      self._modrinth_headers)
+        if compatible is None:
+            self._error(f"Mod '{mod_name}' (project: {project_id}) not found on Modrinth")
+            self._out(f"  [{mod_name}] ✗ PROJECT NOT FOUND on Modrinth")
+            return False
 
-        # Fetch version list
-        manifest_url = source_config['manifest_url'].format(project_id=project_id)
-        headers = {'User-Agent': source_config.get('user_agent', 'minecraft-server-manager/1.0')}
+        if any(ver_info.get('version_number') == version for ver_info in compatible):
+            return self._modrinth_version_found(mod, mod_name, version, project_id)
 
-        versions = self._fetch_json(manifest_url, headers)
+        # Not compatible, fetch the full version list to tell why
+        versions = self._fetch_json(self._modrinth_versions_url(project_id), self._modrinth_headers)
         if not versions:
-            self.errors.append(f"Mod '{mod_name}' (project: {project_id}) not found on Modrinth")
-            print(f"  [{mod_name}] ✗ PROJECT NOT FOUND on Modrinth")
+            self._error(f"Mod '{mod_name}' (project: {project_id}) not found on Modrinth")
+            self._out(f"  [{mod_name}] ✗ PROJECT NOT FOUND on Modrinth")
             return False
 
-        # Get project info to determine environment
-        project_info = self._fetch_json(
-            f"{source_config['api_base']}/project/{project_id}",
-            headers
-        )
-        environment = 'both'  # default
-        if project_info:
-            client_side = project_info.get('client_side', 'required')
-            server_side = project_info.get('server_side', 'required')
-
-            if client_side in ['required', 'optional'] and server_side in ['required', 'optional']:
-                environment = 'both'
-            elif client_side in ['required', 'optional'] and server_side == 'unsupported':
-                environment = 'client'
-            elif server_side in ['required', 'optional'] and client_side == 'unsupported':
-                environment = 'server'
-
-        # Find matching version
-        found_version = False
-        correct_loader = False
-        correct_mc_version = False
-
-        for ver_info in versions:
-            if ver_info.get('version_number') == version:
-                found_version = True
-                loaders = ver_info.get('loaders', []) or []
-                game_versions = ver_info.get('game_versions', []) or []
-
-                if 'fabric' in loaders:
-                    correct_loader = True
-
-                if self.minecraft_version in game_versions:
-                    correct_mc_version = True
-
-                if correct_loader and correct_mc_version:
-                    # Update environment if missing
-                    if 'environment' not in mod:
-                        self.config['mods'][mod_index]['environment'] = environment
-                        self.updates_made.append(f"{mod_name}: added environment={environment}")
-                        self.config_modified = True
-
-                    env_display = f" [{environment}]" if environment != 'both' else ""
-                    print(f"  [{mod_name}] ✓ Version {version} found{env_display}")
-                    return True
+        # A version can be published several times (e.g. per loader), so loader and
+        # Minecraft version have to match on the same entry
+        matches = [ver_info for ver_info in versions if ver_info.get('version_number') == version]
+        fabric_matches = [ver_info for ver_info in matches if 'fabric' in (ver_info.get('loaders', []) or [])]
+
+        found_version = bool(matches)
+        correct_loader = bool(fabric_matches)
+        correct_mc_version = any(self.minecraft_version in (ver_info.get('game_versions', []) or [])
+                                 for ver_info in fabric_matches)
 
         # Handle different error cases
         if not found_version:
-            print(f"  [{mod_name}] ✗ VERSION NOT FOUND: {version}")
+            self._out(f"  [{mod_name}] ✗ VERSION NOT FOUND: {version}")
 
             if self.auto_fix:
                 # Try to find latest compatible version
@@ -489,64 +1002,83 @@ class ConfigValidator:
                 if result:
                     latest_version, latest_env = result
                     env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to latest version: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (environment={latest_env})")
+                    self._out(f"  [{mod_name}] → Auto-fixing to latest version: {latest_version}{env_display}")
+                    mod['version'] = latest_version
+                    mod['environment'] = latest_env
+                    self._update(f"{mod_name}: {version} → {latest_version} (environment={latest_env})")
                     self.config_modified = True
                     return True
                 else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not found and no compatible version available")
-                    print(f"  [{mod_name}] ✗ No compatible version found for MC {self.minecraft_version} + Fabric")
+                    self._error(f"Mod '{mod_name}': version '{version}' not found and no compatible version available")
+                    self._out(f"  [{mod_name}] ✗ No compatible version found for MC {self.minecraft_version} + Fabric")
                     return False
             else:
-                self.errors.append(f"Mod '{mod_name}': version '{version}' not found on Modrinth")
+                self._error(f"Mod '{mod_name}': version '{version}' not found on Modrinth")
                 return False
 
         elif not correct_loader:
-            print(f"  [{mod_name}] ✗ VERSION FOUND but not for Fabric loader")
+            self._out(f"  [{mod_name}] ✗ VERSION FOUND but not for Fabric loader")
 
             if self.auto_fix:
                 result = self._find_latest_modrinth_version(mod_name, project_id)
                 if result:
                     latest_version, latest_env = result
                     env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to latest Fabric version: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (Fabric, environment={latest_env})")
+                    self._out(f"  [{mod_name}] → Auto-fixing to latest Fabric version: {latest_version}{env_display}")
+                    mod['version'] = latest_version
+                    mod['environment'] = latest_env
+                    self._update(f"{mod_name}: {version} → {latest_version} (Fabric, environment={latest_env})")
                     self.config_modified = True
                     return True
                 else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not available for Fabric loader")
+                    self._error(f"Mod '{mod_name}': version '{version}' not available for Fabric loader")
                     return False
             else:
-                self.errors.append(f"Mod '{mod_name}' version '{version}' not available for Fabric loader")
+                self._error(f"Mod '{mod_name}' version '{version}' not available for Fabric loader")
                 return False
 
         elif not correct_mc_version:
-            print(f"  [{mod_name}] ✗ VERSION FOUND but not for MC {self.minecraft_version}")
+            self._out(f"  [{mod_name}] ✗ VERSION FOUND but not for MC {self.minecraft_version}")
 
             if self.auto_fix:
                 result = self._find_latest_modrinth_version(mod_name, project_id)
                 if result:
                     latest_version, latest_env = result
                     env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to version for MC {self.minecraft_version}: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (MC {self.minecraft_version}, environment={latest_env})")
+                    self._out(f"  [{mod_name}] → Auto-fixing to version for MC {self.minecraft_version}: {latest_version}{env_display}")
+                    mod['version'] = latest_version
+                    mod['environment'] = latest_env
+                    self._update(f"{mod_name}: {version} → {latest_version} (MC {self.minecraft_version}, environment={latest_env})")
                     self.config_modified = True
                     return True
                 else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not available for Minecraft {self.minecraft_version}")
+                    self._error(f"Mod '{mod_name}': version '{version}' not available for Minecraft {self.minecraft_version}")
                     return False
             else:
-                self.errors.append(f"Mod '{mod_name}' version '{version}' not available for Minecraft {self.minecraft_version}")
+                self._error(f"Mod '{mod_name}' version '{version}' not available for Minecraft {self.minecraft_version}")
                 return False
 
+        # The full list has a matching Fabric entry the compatible-only list did not return,
+        # report it rather than letting the mod pass unchecked
+        self._error(f"Mod '{mod_name}' version '{version}' not listed by Modrinth as compatible with "
+                    f"Minecraft {self.minecraft_version} + Fabric")
+        self._out(f"  [{mod_name}] ✗ VERSION NOT LISTED as compatible with MC {self.minecraft_version} + Fabric")
         return False
 
+    def _modrinth_version_found(self, mod: dict, mod_name: str, version: str, project_id: str) -> bool:
+        """Report a compatible Modrinth version, adding a missing environment"""
+        # Update environment if missing, project info is only needed for that
+        environment = mod.get('environment')
+        if environment is None:
+            environment = _infer_env(self._get_modrinth_project(project_id))
+            mod['environment'] = environment
+            self._update(f"{mod_name}: added environment={environment}")
+            self.config_modified = True
+
+        env_display = f" [{environment}]" if environment != 'both' else ""
+        self._out(f"  [{mod_name}] ✓ Version {version} found{env_display}")
+        return True
+
     def _find_latest_curseforge_version(self, mod_name: str, project_id: int) -> Optional[Tuple[str, str, int]]:
         """
         Find the latest compatible version for a CurseForge mod
@@ -555,17 +1087,21 @@ class ConfigValidator:
         if not self.curseforge_api_key:
             return None
 
-        source_config = self.mappings['sources']['curseforge']
-        files_url = source_config['files_url'].format(project_id=project_id)
-        headers = {
-            'Accept': 'application/json',
-            'x-api-key': self.curseforge_api_key
-        }
+        # The Minecraft version is fixed for the run, so the result only depends on the project
+        key = str(project_id)
+        if key not in self._curseforge_latest:
+            self._curseforge_latest[key] = self._search_latest_curseforge_version(project_id)
+        return self._curseforge_latest[key]
+
+    def _search_latest_curseforge_version(self, project_id: int) -> Optional[Tuple[str, str, int]]:
+        """Search a CurseForge project's files for the latest one compatible with our MC version and Fabric"""
+        files_url = self._curseforge_files_url(project_id)
+        headers = self._curseforge_headers
 
         # Get mod info for environment
-        mod_info_url = source_config['mod_info_url'].format(project_id=project_id)
-        print(f"  DEBUG: Fetching mod info from {mod_info_url}")
-        mod_info = self._fetch_json(mod_info_url, headers, debug=True)
+        mod_info_url = self._curseforge_mod_info_url(project_id)
+        self._debug("  DEBUG: Fetching mod info from %s", mod_info_url)
+        mod_info = self._get_curseforge_mod_info(project_id)
 
         environment = 'both'  # default
         if mod_info and 'data' in mod_info:
@@ -574,26 +1110,27 @@ class ConfigValidator:
             # We'll default to 'both' for now
             environment = 'both'
 
-        # Get files list with pagination parameters
-        files_url_with_params = f"{files_url}?gameVersion={self.minecraft_version}"
-        print(f"  DEBUG: Fetching files from {files_url_with_params}")
-        files_response = self._fetch_json(files_url_with_params, headers, debug=True)
+        # Let the API drop files for other MC versions and loaders (modLoaderType 4 = Fabric)
+        files_url_with_params = f"{files_url}?gameVersion={self.minecraft_version}&modLoaderType=4"
+        self._debug("  DEBUG: Fetching files from %s", files_url_with_params)
+        files_response = self._fetch_json(files_url_with_params, headers)
         if not files_response or 'data' not in files_response:
-            print(f"  DEBUG: No files response or missing 'data' field")
+            self._debug("  DEBUG: No files response or missing 'data' field")
             if files_response:
-                print(f"  DEBUG: Response keys: {list(files_response.keys())}")
+                self._debug("  DEBUG: Response keys: %s", files_response.keys())
             return None
 
         files = files_response['data']
-        print(f"  DEBUG: Found {len(files)} files for latest version search")
+        self._debug("  DEBUG: Found %s files for latest version search", len(files))
 
         # Find the latest version that matches our criteria
         # Filter for Fabric loader (modLoaderId = 4 for Fabric)
         for file_info in files:
-            game_versions = file_info.get('gameVersions', []) or []
+            # CurseForge lists loaders ("Fabric") and MC versions as exact entries
+            game_versions = set(file_info.get('gameVersions') or ())
 
             # Check if it's for the right MC version and Fabric
-            has_fabric = any('Fabric' in gv for gv in game_versions)
+            has_fabric = 'Fabric' in game_versions
             has_mc_version = self.minecraft_version in game_versions
 
             if has_fabric and has_mc_version:
@@ -604,168 +1141,152 @@ class ConfigValidator:
 
         return None
 
-    def _validate_curseforge_mod(self, mod: dict, mod_index: int, mod_name: str,
+    def _validate_curseforge_mod(self, mod: dict, mod_name: str,
                                  version: str, project_id: int) -> bool:
         """Validate a CurseForge mod version"""
         if not self.curseforge_api_key:
-            self.errors.append(f"Mod '{mod_name}': CurseForge API key not set. Set CURSEFORGE_API_KEY environment variable.")
-            print(f"  [{mod_name}] ✗ CurseForge API key not set")
+            self._error(f"Mod '{mod_name}': CurseForge API key not set. Set CURSEFORGE_API_KEY environment variable.")
+            self._out(f"  [{mod_name}] ✗ CurseForge API key not set")
             return False
 
-        source_config = self.mappings['sources']['curseforge']
-
         # Get mod info for environment
-        mod_info_url = source_config['mod_info_url'].format(project_id=project_id)
-        headers = {
-            'Accept': 'application/json',
-            'x-api-key': self.curseforge_api_key
-        }
+        mod_info_url = self._curseforge_mod_info_url(project_id)
+        headers = self._curseforge_headers
 
-        print(f"  [{mod_name}] DEBUG: Fetching from {mod_info_url}")
-        mod_info = self._fetch_json(mod_info_url, headers, debug=True)
+        self._debug("  [%s] DEBUG: Fetching from %s", mod_name, mod_info_url)
+        mod_info = self._get_curseforge_mod_info(project_id)
 
         if not mod_info:
-            self.errors.append(f"Mod '{mod_name}' (project_id: {project_id}) - API returned no response")
-            print(f"  [{mod_name}] ✗ API RETURNED NO RESPONSE")
-            print(f"  [{mod_name}] DEBUG: URL was {mod_info_url}")
+            self._error(f"Mod '{mod_name}' (project_id: {project_id}) - API returned no response")
+            self._out(f"  [{mod_name}] ✗ API RETURNED NO RESPONSE")
+            self._debug("  [%s] DEBUG: URL was %s", mod_name, mod_info_url)
             return False
 
         if 'data' not in mod_info:
-            self.errors.append(f"Mod '{mod_name}' (project_id: {project_id}) not found on CurseForge")
-            print(f"  [{mod_name}] ✗ PROJECT NOT FOUND on CurseForge")
-            print(f"  [{mod_name}] DEBUG: Response structure: {list(mod_info.keys())}")
+            self._error(f"Mod '{mod_name}' (project_id: {project_id}) not found on CurseForge")
+            self._out(f"  [{mod_name}] ✗ PROJECT NOT FOUND on CurseForge")
+            self._debug("  [%s] DEBUG: Response structure: %s", mod_name, mod_info.keys())
             if 'error' in mod_info or 'message' in mod_info:
-                print(f"  [{mod_name}] DEBUG: Error message: {mod_info.get('error') or mod_info.get('message')}")
+                self._debug("  [%s] DEBUG: Error message: %s", mod_name, mod_info.get('error') or mod_info.get('message'))
             return False
 
         environment = 'both'  # CurseForge doesn't provide explicit environment info
 
+        # A pinned file is checked on its own instead of searching the project's files
+        if mod.get('file_id'):
+            file_info = self._get_curseforge_file(project_id, mod['file_id'])
+            if file_info is not None and (version == str(file_info.get('id'))
+                                          or version in file_info.get('displayName', '')):
+                game_versions = set(file_info.get('gameVersions') or ())
+                if 'Fabric' in game_versions and self.minecraft_version in game_versions:
+                    return self._curseforge_version_found(mod, mod_name, version,
+                                                          environment, file_info.get('id'))
+
         # Get files list
-        files_url = source_config['files_url'].format(project_id=project_id)
-        print(f"  [{mod_name}] DEBUG: Fetching files from {files_url}")
-        files_response = self._fetch_json(files_url, headers, debug=True)
+        files_url = self._curseforge_files_url(project_id)
+        self._debug("  [%s] DEBUG: Fetching files from %s", mod_name, files_url)
+        files_response = self._fetch_json(files_url, headers)
 
         if not files_response or 'data' not in files_response:
-            self.errors.append(f"Mod '{mod_name}': Failed to fetch files from CurseForge")
-            print(f"  [{mod_name}] ✗ Failed to fetch files")
+            self._error(f"Mod '{mod_name}': Failed to fetch files from CurseForge")
+            self._out(f"  [{mod_name}] ✗ Failed to fetch files")
             if files_response:
-                print(f"  [{mod_name}] DEBUG: Files response structure: {list(files_response.keys())}")
+                self._debug("  [%s] DEBUG: Files response structure: %s", mod_name, files_response.keys())
             return False
 
         files = files_response['data']
-        print(f"  [{mod_name}] DEBUG: Found {len(files)} files")
+        self._debug("  [%s] DEBUG: Found %s files", mod_name, len(files))
 
         # Find matching version (can be file ID or display name)
-        found_version = False
-        correct_loader = False
-        correct_mc_version = False
-        matched_file_id = None
-
-        for file_info in files:
-            file_id_str = str(file_info.get('id', ''))
-            display_name = file_info.get('displayName', '')
-
-            # Check if version matches file ID or display name
-            if version == file_id_str or version in display_name:
-                found_version = True
-                game_versions = file_info.get('gameVersions', []) or []
-
-                # Check for Fabric loader
-                if any('Fabric' in gv for gv in game_versions):
-                    correct_loader = True
-
-                # Check for MC version
-                if self.minecraft_version in game_versions:
-                    correct_mc_version = True
-
-                if correct_loader and correct_mc_version:
-                    matched_file_id = file_info.get('id')
-                    # Update environment if missing
-                    if 'environment' not in mod:
-                        self.config['mods'][mod_index]['environment'] = environment
-                        self.updates_made.append(f"{mod_name}: added environment={environment}")
-                        self.config_modified = True
-
-                    # Store file_id if not present
-                    if 'file_id' not in mod and matched_file_id:
-                        self.config['mods'][mod_index]['file_id'] = matched_file_id
-                        self.updates_made.append(f"{mod_name}: added file_id={matched_file_id}")
-                        self.config_modified = True
-
-                    env_display = f" [{environment}]" if environment != 'both' else ""
-                    print(f"  [{mod_name}] ✓ Version {version} found{env_display}")
-                    return True
+        # Look the version up as a file ID first, otherwise match it against display names.
+        # File IDs are numeric, so other versions skip the ID lookup entirely
+        by_id = None
+        if version.isdigit():
+            by_id = next((file_info for file_info in files if str(file_info.get('id', '')) == version), None)
+        if by_id is not None:
+            candidates = [by_id]
+        else:
+            candidates = [file_info for file_info in files if version in file_info.get('displayName', '')]
+
+        # Several files can match a display name (e.g. per loader), so loader and
+        # Minecraft version have to match on the same file. CurseForge lists
+        # loaders ("Fabric") and MC versions as exact gameVersions entries
+        fabric_candidates = [file_info for file_info in candidates
+                             if 'Fabric' in (file_info.get('gameVersions') or ())]
+        matched = next((file_info for file_info in fabric_candidates
+                        if self.minecraft_version in (file_info.get('gameVersions') or ())), None)
+        if matched is not None:
+            return self._curseforge_version_found(mod, mod_name, version,
+                                                  environment, matched.get('id'))
 
         # Handle different error cases
-        if not found_version:
-            print(f"  [{mod_name}] ✗ VERSION NOT FOUND: {version}")
+        if not candidates:
+            reason = 'not_found'
+        elif not fabric_candidates:
+            reason = 'loader'
+        else:
+            reason = 'mc_version'
+        return self._reject_curseforge_version(mod, mod_name, version, project_id, reason)
 
-            if self.auto_fix:
-                result = self._find_latest_curseforge_version(mod_name, project_id)
-                if result:
-                    latest_version, latest_env, latest_file_id = result
-                    env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to latest version: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['file_id'] = latest_file_id
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (file_id={latest_file_id}, environment={latest_env})")
-                    self.config_modified = True
-                    return True
-                else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not found and no compatible version available")
-                    print(f"  [{mod_name}] ✗ No compatible version found for MC {self.minecraft_version} + Fabric")
-                    return False
-            else:
-                self.errors.append(f"Mod '{mod_name}': version '{version}' not found on CurseForge")
-                return False
+    def _reject_curseforge_version(self, mod: dict, mod_name: str, version: str,
+                                   project_id: int, reason: str) -> bool:
+        """
+        Report why a CurseForge version can't be used and, in auto-fix mode, switch
+        the mod to the latest compatible file
+        Args:
+            reason: Key of _CURSEFORGE_REJECTIONS
+        """
+        messages = _CURSEFORGE_REJECTIONS[reason]
+        fields = {'mod_name': mod_name, 'version': version, 'mc': self.minecraft_version}
+        self._out(f"  [{mod_name}] ✗ " + messages['problem'].format(**fields))
 
-        elif not correct_loader:
-            print(f"  [{mod_name}] ✗ VERSION FOUND but not for Fabric loader")
-            if self.auto_fix:
-                result = self._find_latest_curseforge_version(mod_name, project_id)
-                if result:
-                    latest_version, latest_env, latest_file_id = result
-                    env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to latest Fabric version: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['file_id'] = latest_file_id
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (Fabric, file_id={latest_file_id}, environment={latest_env})")
-                    self.config_modified = True
-                    return True
-                else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not available for Fabric loader")
-                    return False
-            else:
-                self.errors.append(f"Mod '{mod_name}' version '{version}' not available for Fabric loader")
-                return False
+        if not self.auto_fix:
+            self._error(messages['error'].format(**fields))
+            return False
 
-        elif not correct_mc_version:
-            print(f"  [{mod_name}] ✗ VERSION FOUND but not for MC {self.minecraft_version}")
-            if self.auto_fix:
-                result = self._find_latest_curseforge_version(mod_name, project_id)
-                if result:
-                    latest_version, latest_env, latest_file_id = result
-                    env_display = f" [{latest_env}]" if latest_env != 'both' else ""
-                    print(f"  [{mod_name}] → Auto-fixing to version for MC {self.minecraft_version}: {latest_version}{env_display}")
-                    self.config['mods'][mod_index]['version'] = latest_version
-                    self.config['mods'][mod_index]['file_id'] = latest_file_id
-                    self.config['mods'][mod_index]['environment'] = latest_env
-                    self.updates_made.append(f"{mod_name}: {version} → {latest_version} (MC {self.minecraft_version}, file_id={latest_file_id}, environment={latest_env})")
-                    self.config_modified = True
-                    return True
-                else:
-                    self.errors.append(f"Mod '{mod_name}': version '{version}' not available for Minecraft {self.minecraft_version}")
-                    return False
-            else:
-                self.errors.append(f"Mod '{mod_name}' version '{version}' not available for Minecraft {self.minecraft_version}")
-                return False
+        result = self._find_latest_curseforge_version(mod_name, project_id)
+        if not result:
+            self._error(messages['no_fix'].format(**fields))
+            if reason == 'not_found':
+                self._out(f"  [{mod_name}] ✗ No compatible version found for MC {self.minecraft_version} + Fabric")
+            return False
 
-        return False
+        latest_version, latest_env, latest_file_id = result
+        env_display = f" [{latest_env}]" if latest_env != 'both' else ""
+        self._out(f"  [{mod_name}] → Auto-fixing to {messages['fix'].format(**fields)}: {latest_version}{env_display}")
+        mod['version'] = latest_version
+        mod['file_id'] = latest_file_id
+        mod['environment'] = latest_env
+        self._update(f"{mod_name}: {version} → {latest_version} "
+                     f"({messages['note'].format(**fields)}file_id={latest_file_id}, environment={latest_env})")
+        self.config_modified = True
+        return True
+
+    def _curseforge_version_found(self, mod: dict, mod_name: str, version: str,
+                                  environment: str, file_id: Optional[int]) -> bool:
+        """Report a compatible CurseForge version, adding a missing environment and file_id"""
+        # Update environment if missing
+        if 'environment' not in mod:
+            mod['environment'] = environment
+            self._update(f"{mod_name}: added environment={environment}")
+            self.config_modified = True
 
-    def validate_mod_versions(self) -> bool:
-        """Validate all mod versions"""
+        # Store file_id if not present
+        if 'file_id' not in mod and file_id:
+            mod['file_id'] = file_id
+            self._update(f"{mod_name}: added file_id={file_id}")
+            self.config_modified = True
+
+        env_display = f" [{environment}]" if environment != 'both' else ""
+        self._out(f"  [{mod_name}] ✓ Version {version} found{env_display}")
+        return True
+
+    def validate_mod_versions(self, executor: Optional[ThreadPoolExecutor] = None) -> bool:
+        """
+        Validate all mod versions
+        Args:
+            executor: Worker pool to validate the mods on, a new one is used if not given
+        """
         if not self.config or 'mods' not in self.config:
             return True
 
@@ -777,14 +1298,59 @@ class ConfigValidator:
         if self.auto_fix:
             print("(Auto-fix mode enabled - will update config with latest compatible versions)")
 
+        if self._unchanged_mods:
+            print(f"({len(self._unchanged_mods)} mod(s) unchanged since their last successful validation are skipped)")
+
+        # Mods are validated concurrently, their output and results are buffered
+        # per mod and reported in config order
         all_valid = True
-        for i, mod in enumerate(mods):
-            if isinstance(mod, dict) and 'name' in mod:
-                if not self.validate_mod_version(mod, i):
+        tasks = self._mod_tasks()
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            results = executor.map(lambda task: self._buffered(self.validate_mod_version, *task), tasks)
+            for (mod, _), (valid, buffer) in zip(tasks, results):
+                self._flush_buffer(buffer)
+                if valid:
+                    # Hashed after validation, so entries completed by auto-fix are remembered as saved
+                    self._validated_mods[self._hash_mod(mod)] = time.time()
+                else:
                     all_valid = False
+        finally:
+            if own_executor:
+                executor.shutdown()
 
         return all_valid
 
+    def _mod_tasks(self) -> List[Tuple[dict, int]]:
+        """(mod, index) of every mod entry that can be validated and was not validated recently"""
+        mods = self.config.get('mods') if self.config else None
+        if not isinstance(mods, list):
+            return []
+        return [(mod, i) for i, mod in enumerate(mods)
+                if isinstance(mod, dict) and 'name' in mod and i not in self._unchanged_mods]
+
+    def _buffered(self, func, *args) -> Tuple[object, Dict[str, List[str]]]:
+        """
+        Call func with its output, errors, warnings and updates collected in a buffer
+        Returns: (result, buffer)
+        """
+        buffer = {'output': [], 'errors': [], 'warnings': [], 'updates_made': []}
+        self._local.buffer = buffer
+        try:
+            return func(*args), buffer
+        finally:
+            self._local.buffer = None
+
+    def _flush_buffer(self, buffer: Dict[str, List[str]]):
+        """Print buffered output and record buffered results"""
+        if buffer['output']:
+            print("\n".join(buffer['output']))
+        self.errors.extend(buffer['errors'])
+        self.warnings.extend(buffer['warnings'])
+        self.updates_made.extend(buffer['updates_made'])
+
     def validate(self) -> bool:
         """Run all validation checks"""
         print("="*70)
@@ -795,18 +1361,34 @@ class ConfigValidator:
         if self.auto_fix:
             print(f"Auto-fix mode: ENABLED")
 
+        if self.use_cache and self._recently_validated():
+            print("\n✓ Config unchanged since the last successful validation, skipping checks")
+            print("  (use --no-cache to validate again)")
+            return True
+
         # Step 1: Validate structure
         if not self.validate_structure():
             return False
 
-        # Step 2: Validate Minecraft version
-        minecraft_valid = self.validate_minecraft_version()
+        if self.use_cache:
+            self._load_validated_mods()
+
+        # The workers that validate the mods first bulk load Modrinth projects and
+        # CurseForge mods in the background while the Minecraft and Fabric versions are checked
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            prefetch = executor.submit(self._buffered, self._prefetch_projects,
+                                       [mod for mod, _ in self._mod_tasks()])
+
+            # Step 2: Validate Minecraft version
+            minecraft_valid = self.validate_minecraft_version()
 
-        # Step 3: Validate Fabric version
-        fabric_valid = self.validate_fabric_version()
+            # Step 3: Validate Fabric version
+            fabric_valid = self.validate_fabric_version()
 
-        # Step 4: Validate mod versions
-        mods_valid = self.validate_mod_versions()
+            self._flush_buffer(prefetch.result()[1])
+
+            # Step 4: Validate mod versions
+            mods_valid = self.validate_mod_versions(executor)
 
         # Save config if modifications were made
         if self.config_modified:
@@ -820,7 +1402,9 @@ class ConfigValidator:
             for update in self.updates_made:
                 print(f"  • {update}")
 
-            self._save_yaml()
+            if not self._save_yaml():
+                # The config on disk still has the problems auto-fix found, never record it as validated
+                self.errors.append(f"Failed to save the updated config to {self.config_file}")
 
         # Final report
         print("\n" + "="*70)
@@ -841,7 +1425,8 @@ class ConfigValidator:
 
         print("="*70)
 
-        return len(self.errors) == 0
+        self._save_state(not self.errors)
+        return not self.errors
 
 
 def main():
@@ -867,16 +1452,34 @@ def main():
         action='store_true',
         help='Automatically update config with latest compatible versions when version not found'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached API responses and earlier validation results and always query the APIs'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=MAX_WORKERS,
+        help=f'Number of mods validated in parallel (default: {MAX_WORKERS}, 1 disables parallelism)'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Print API request details (same as VALIDATE_DEBUG=1)'
+    )
 
     args = parser.parse_args()
+    _setup_logging(logging.DEBUG if args.verbose or DEBUG else logging.INFO)
 
-    validator = ConfigValidator(
+    with ConfigValidator(
         config_file=args.config,
         mappings_file=args.mappings,
-        auto_fix=args.auto_fix
-    )
-
-    success = validator.validate()
+        auto_fix=args.auto_fix,
+        use_cache=not args.no_cache,
+        max_workers=args.jobs
+    ) as validator:
+        success = validator.validate()
     sys.exit(0 if success else 1)
 
 